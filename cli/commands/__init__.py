@@ -0,0 +1 @@
+# CLI subcommands for ReviewLab, loaded on demand by cli.main.LazyGroup
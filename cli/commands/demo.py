@@ -0,0 +1,239 @@
+"""
+Demo command for ReviewLab.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cli.output import Echo, format_evaluation_results, format_match_details
+from core.errors import ErrorHandler
+
+_REPORTS_DIR = Path("reports")
+
+# Sample data for the demo; "{language}" in file paths is filled in per run
+_DEMO_GROUND_TRUTH = (
+    {
+        "id": "gt_001",
+        "injection_id": "injection_001",
+        "template_id": "null_pointer",
+        "project_path": "/demo/project",
+        "file_path": "src/Calculator.{language}",
+        "line_number": 25,
+        "bug_type": "correctness",
+        "description": "Null pointer dereference in calculator method",
+        "severity": "high",
+        "difficulty": "medium",
+        "injection_timestamp": "2024-01-01T10:00:00",
+        "original_code": "result = value.calculate();",
+        "modified_code": "result = null.calculate();",
+    },
+    {
+        "id": "gt_002",
+        "injection_id": "injection_002",
+        "template_id": "array_bounds",
+        "project_path": "/demo/project",
+        "file_path": "src/ArrayProcessor.{language}",
+        "line_number": 42,
+        "bug_type": "correctness",
+        "description": "Array index out of bounds access",
+        "severity": "medium",
+        "difficulty": "easy",
+        "injection_timestamp": "2024-01-01T10:05:00",
+        "original_code": "return array[index];",
+        "modified_code": "return array[array.length + 1];",
+    },
+    {
+        "id": "gt_003",
+        "injection_id": "injection_003",
+        "template_id": "resource_leak",
+        "project_path": "/demo/project",
+        "file_path": "src/FileHandler.{language}",
+        "line_number": 67,
+        "bug_type": "correctness",
+        "description": "Resource leak in file handling",
+        "severity": "medium",
+        "difficulty": "hard",
+        "injection_timestamp": "2024-01-01T10:10:00",
+        "original_code": "FileInputStream fis = new FileInputStream(file);",
+        "modified_code": "FileInputStream fis = new FileInputStream(file); // Missing close()",
+    },
+)
+
+# All sample findings use the default finding type (FindingType.BUG)
+_DEMO_FINDINGS = (
+    {
+        "id": "finding_001",
+        "file_path": "src/Calculator.{language}",
+        "line_number": 25,
+        "severity": "high",
+        "confidence": 0.9,
+        "message": "Potential null pointer dereference",
+        "rule_id": "NP_NULL_ON_SOME_PATH",
+        "category": "correctness",
+    },
+    {
+        "id": "finding_002",
+        "file_path": "src/ArrayProcessor.{language}",
+        "line_number": 42,
+        "severity": "medium",
+        "confidence": 0.8,
+        "message": "Array index out of bounds",
+        "rule_id": "AI_ANNOTATION_ISSUES",
+        "category": "correctness",
+    },
+    {
+        "id": "finding_003",
+        "file_path": "src/FileHandler.{language}",
+        "line_number": 70,
+        "severity": "medium",
+        "confidence": 0.7,
+        "message": "Resource leak detected",
+        "rule_id": "OS_OPEN_STREAM",
+        "category": "correctness",
+    },
+    {
+        "id": "finding_004",
+        "file_path": "src/Calculator.{language}",
+        "line_number": 30,
+        "severity": "low",
+        "confidence": 0.6,
+        "message": "Unused variable warning",
+        "rule_id": "URF_UNREAD_FIELD",
+        "category": "style",
+    },
+    {
+        "id": "finding_005",
+        "file_path": "src/Utils.{language}",
+        "line_number": 15,
+        "severity": "high",
+        "confidence": 0.9,
+        "message": "SQL injection vulnerability",
+        "rule_id": "SQL_NONCONSTANT_STRING_PASSED_TO_EXECUTE",
+        "category": "security",
+    },
+)
+
+
+@click.command()
+@click.option("--language", "-l", default="java", help="Target language for demo (default: java)")
+@click.option(
+    "--output-dir", type=click.Path(), help="Output directory for reports (default: reports/)"
+)
+@click.option("--verbose", is_flag=True, help="Show detailed evaluation information")
+@click.pass_context
+def demo(ctx, language, output_dir, verbose):
+    """Run a quick evaluation demo with sample data."""
+    config = ctx.obj["config"]
+
+    echo = Echo()
+
+    try:
+        echo(f"🎭 Running evaluation demo for {language}...")
+        echo("This will create sample ground truth and review findings, then evaluate them.")
+
+        # Import required components
+        from core.bug_injection import GroundTruthEntry
+        from core.evaluation import EvaluationEngine, MatchStrategy, ReviewFinding
+        from core.report_generator import generate_reports
+
+        # Create sample ground truth
+        echo("📝 Creating sample ground truth data...")
+        ground_truth_entries = [
+            GroundTruthEntry(
+                **{
+                    **fields,
+                    "language": language,
+                    "file_path": fields["file_path"].format(language=language),
+                }
+            )
+            for fields in _DEMO_GROUND_TRUTH
+        ]
+
+        # Create sample review findings
+        echo("📝 Creating sample review findings...")
+        review_findings = [
+            ReviewFinding(**{**fields, "file_path": fields["file_path"].format(language=language)})
+            for fields in _DEMO_FINDINGS
+        ]
+
+        echo(f"✅ Created {len(ground_truth_entries)} ground truth entries")
+        echo(f"✅ Created {len(review_findings)} review findings")
+
+        # Run evaluation
+        echo("🚀 Running evaluation...")
+        echo.flush()
+        evaluation_engine = EvaluationEngine()
+
+        strategies = [
+            MatchStrategy.EXACT_OVERLAP,
+            MatchStrategy.LINE_RANGE_OVERLAP,
+            MatchStrategy.SEMANTIC_SIMILARITY,
+            MatchStrategy.BREADCRUMB_MATCHING,
+        ]
+
+        evaluation_result = evaluation_engine.evaluate_review(
+            review_findings=review_findings,
+            ground_truth_entries=ground_truth_entries,
+            review_tool="Demo Review Bot",
+            strategies=strategies,
+        )
+
+        # Display results
+        echo(format_evaluation_results(evaluation_result.metrics))
+        echo()
+
+        # Generate reports
+        echo("📝 Generating reports...")
+        echo.flush()
+        output_directory = Path(output_dir) if output_dir else _REPORTS_DIR
+        output_directory.mkdir(parents=True, exist_ok=True)
+
+        # Generate all report formats concurrently
+        formats_to_generate = ["json", "csv", "txt", "html"]
+        report_stem = f"demo_evaluation_{evaluation_result.session_id}"
+        report_files = generate_reports(
+            evaluation_result,
+            [
+                (format_type, output_directory / f"{report_stem}.{format_type}")
+                for format_type in formats_to_generate
+            ],
+            include_detailed_matches=True,
+            include_unmatched_items=True,
+        )
+
+        generated_reports = []
+        for format_type, report_file in zip(formats_to_generate, report_files):
+            generated_reports.append(report_file)
+            echo(f"  ✅ Generated {format_type.upper()} report: {report_file.name}")
+
+        # Generate summary
+        echo("📋 Generating summary report...")
+        summary = evaluation_engine.generate_summary_report(evaluation_result)
+        summary_file = output_directory / f"demo_summary_{evaluation_result.session_id}.txt"
+        summary_file.write_text(summary, encoding="utf-8")
+        generated_reports.append(summary_file)
+        echo(f"  ✅ Generated summary report: {summary_file.name}")
+
+        echo()
+        echo("🎉 Demo completed successfully!")
+        echo(f"📁 Reports saved to: {output_directory}")
+        echo(f"📊 Session ID: {evaluation_result.session_id}")
+
+        if verbose:
+            echo()
+            echo(format_match_details(evaluation_result.matches))
+
+        echo()
+        echo("💡 Next steps:")
+        echo("  1. Review the generated reports")
+        echo("  2. Try 'reviewlab generate-pr' to inject real bugs")
+        echo("  3. Use 'reviewlab evaluate' with your own data")
+
+    except Exception as e:
+        echo.flush()
+        ErrorHandler.handle_error(e, "Demo")
+        sys.exit(1)
+    finally:
+        echo.flush()
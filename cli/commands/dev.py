@@ -0,0 +1,42 @@
+"""
+Developer utilities for ReviewLab.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from core.errors import ErrorHandler
+from core.template_cache import TemplateCache
+
+
+@click.group()
+def dev():
+    """Developer and maintenance utilities."""
+    pass
+
+
+@dev.command("refresh-cache")
+@click.option(
+    "--template-dir",
+    type=click.Path(),
+    default="tooling/bug_templates",
+    help="Bug template directory to re-index (default: tooling/bug_templates)",
+)
+def refresh_cache(template_dir):
+    """Rebuild the on-disk bug template cache."""
+    try:
+        from core.bug_templates import BugTemplateManager
+
+        cache = TemplateCache()
+        if cache.clear():
+            click.echo(f"🗑️  Removed stale cache: {cache.cache_file}")
+
+        manager = BugTemplateManager(Path(template_dir), cache=cache)
+        click.echo(f"✅ Cached {manager.get_template_count()} bug templates")
+        click.echo(f"📁 Cache file: {cache.cache_file}")
+
+    except Exception as e:
+        ErrorHandler.handle_error(e, "Cache refresh")
+        sys.exit(1)
@@ -0,0 +1,171 @@
+"""
+Evaluate command for ReviewLab.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from cli.output import Echo, format_evaluation_results, format_match_details
+from core.errors import ErrorHandler
+
+_REPORTS_DIR = Path("reports")
+
+
+@click.command()
+@click.option(
+    "--findings", required=True, type=click.Path(exists=True), help="Path to bot findings JSON file"
+)
+@click.option(
+    "--ground-truth",
+    required=True,
+    type=click.Path(exists=True),
+    help="Path to ground truth JSONL file",
+)
+@click.option("--review-tool", default="unknown", help="Name of the review tool being evaluated")
+@click.option(
+    "--strategies",
+    default="exact_overlap,line_range_overlap,semantic_similarity",
+    help="Comma-separated list of matching strategies to use",
+)
+@click.option(
+    "--output-format",
+    default="all",
+    type=click.Choice(["json", "csv", "txt", "html", "all"]),
+    help="Output format for reports (default: all)",
+)
+@click.option(
+    "--output-dir", type=click.Path(), help="Output directory for reports (default: reports/)"
+)
+@click.option("--verbose", is_flag=True, help="Show detailed evaluation information")
+@click.pass_context
+def evaluate(
+    ctx, findings, ground_truth, review_tool, strategies, output_format, output_dir, verbose
+):
+    """Evaluate code review bot findings against ground truth data."""
+    config = ctx.obj["config"]
+
+    echo = Echo()
+
+    try:
+        echo(f"🔍 Evaluating {review_tool} findings against ground truth...")
+        echo(f"📁 Findings file: {findings}")
+        echo(f"📁 Ground truth file: {ground_truth}")
+        echo(f"🎯 Matching strategies: {strategies}")
+        echo(f"📊 Output format: {output_format}")
+
+        # Parse strategies
+        strategy_list = [s.strip() for s in strategies.split(",")]
+
+        # Import evaluation components
+        from core.evaluation import (
+            MATCH_STRATEGIES_BY_VALUE,
+            EvaluationEngine,
+            MatchStrategy,
+            load_review_findings,
+        )
+        from core.report_generator import generate_reports
+
+        # Load review findings
+        echo("📖 Loading review findings...")
+        echo.flush()
+        review_findings = load_review_findings(findings)
+
+        echo(f"✅ Loaded {len(review_findings)} review findings")
+
+        # Load ground truth
+        echo("📖 Loading ground truth data...")
+        from core.bug_injection import load_ground_truth_file
+
+        ground_truth_entries = load_ground_truth_file(
+            ground_truth,
+            on_error=lambda line_num, e: echo(f"⚠️  Warning: Failed to parse line {line_num}: {e}"),
+        )
+
+        echo(f"✅ Loaded {len(ground_truth_entries)} ground truth entries")
+
+        # Run evaluation
+        echo("🚀 Running evaluation...")
+        echo.flush()
+        evaluation_engine = EvaluationEngine()
+
+        # Convert strategy names to enum values
+        strategy_enums = []
+        for strategy_name in strategy_list:
+            strategy = MATCH_STRATEGIES_BY_VALUE.get(strategy_name)
+            if strategy is None:
+                echo(f"⚠️  Warning: Unknown strategy '{strategy_name}', skipping")
+            else:
+                strategy_enums.append(strategy)
+
+        if not strategy_enums:
+            echo("❌ No valid strategies specified. Using defaults.")
+            strategy_enums = [
+                MatchStrategy.EXACT_OVERLAP,
+                MatchStrategy.LINE_RANGE_OVERLAP,
+                MatchStrategy.SEMANTIC_SIMILARITY,
+            ]
+
+        evaluation_result = evaluation_engine.evaluate_review(
+            review_findings=review_findings,
+            ground_truth_entries=ground_truth_entries,
+            review_tool=review_tool,
+            strategies=strategy_enums,
+        )
+
+        # Display results
+        echo(format_evaluation_results(evaluation_result.metrics))
+        echo()
+
+        # Generate reports
+        echo("📝 Generating reports...")
+        echo.flush()
+        output_directory = Path(output_dir) if output_dir else _REPORTS_DIR
+        output_directory.mkdir(parents=True, exist_ok=True)
+
+        if output_format == "all":
+            formats_to_generate = ["json", "csv", "txt", "html"]
+        else:
+            formats_to_generate = [output_format]
+
+        # Serialize the evaluation once and render every format concurrently
+        report_stem = f"evaluation_report_{evaluation_result.session_id}"
+        report_files = generate_reports(
+            evaluation_result,
+            [
+                (format_type, output_directory / f"{report_stem}.{format_type}")
+                for format_type in formats_to_generate
+            ],
+            include_detailed_matches=True,
+            include_unmatched_items=True,
+        )
+
+        generated_reports = []
+        for format_type, report_file in zip(formats_to_generate, report_files):
+            generated_reports.append(report_file)
+            echo(f"  ✅ Generated {format_type.upper()} report: {report_file.name}")
+
+        # Generate summary
+        echo("📋 Generating summary report...")
+        summary = evaluation_engine.generate_summary_report(evaluation_result)
+        summary_file = output_directory / f"evaluation_summary_{evaluation_result.session_id}.txt"
+        summary_file.write_text(summary, encoding="utf-8")
+        generated_reports.append(summary_file)
+        echo(f"  ✅ Generated summary report: {summary_file.name}")
+
+        echo()
+        echo("🎉 Evaluation completed successfully!")
+        echo(f"📁 Reports saved to: {output_directory}")
+        echo(f"📊 Session ID: {evaluation_result.session_id}")
+
+        if verbose:
+            echo()
+            echo(format_match_details(evaluation_result.matches))
+
+    except Exception as e:
+        echo.flush()
+        ErrorHandler.handle_error(e, "Evaluation")
+        sys.exit(1)
+    finally:
+        echo.flush()
@@ -0,0 +1,352 @@
+"""
+Generate PR command for ReviewLab.
+"""
+
+import contextlib
+import sys
+from pathlib import Path
+
+import click
+
+from cli.output import Echo
+from core.errors import ErrorHandler
+
+_CWD = Path(".")
+_GROUND_TRUTH_DIR = Path("ground_truth")
+
+# GitHub PR body templates, filled in with str.format
+_PR_HEADER = """## Bug Injection Test PR
+
+This PR contains {count} intentionally injected bugs for testing code review bot accuracy.
+
+**Session ID**: {session_id}
+**Language**: {language}
+**Bug Count**: {count}
+**Generated**: {generated}
+
+### Injected Bugs:
+"""
+
+_PR_BUG_ENTRY = """
+{i}. **{name}** ({category})
+   - **File**: {file_path}:{line_number}
+   - **Severity**: {severity}
+   - **Difficulty**: {difficulty}
+   - **Description**: {description}
+"""
+
+_PR_FOOTER = """
+
+### Next Steps:
+1. Review the injected bugs
+2. Run your code review bot on this PR
+3. Use 'reviewlab evaluate' to measure accuracy
+4. Close this PR when testing is complete
+
+---
+*Generated by ReviewLab - Bug Injection Testing Tool*
+"""
+
+
+@click.command()
+@click.option("--count", "-n", default=5, help="Number of bugs to inject (default: 5)")
+@click.option("--types", "-t", help="Comma-separated list of bug types to use")
+@click.option("--seed", "-s", type=int, help="Random seed for reproducible generation")
+@click.option("--title", help="Custom PR title")
+@click.option("--base", default="main", help="Base branch (default: main)")
+@click.option("--auto-push", is_flag=True, help="Automatically push branch and create PR")
+@click.option("--dry-run", is_flag=True, help="Show what would be done without making changes")
+@click.option("--github-repo", help="GitHub repository (owner/repo or full URL) for remote PR creation")
+@click.option("--github-token", help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)")
+@click.option("--github-username", help="GitHub username (or set GITHUB_USERNAME env var)")
+@click.option("--draft", is_flag=True, help="Create PR as draft")
+@click.pass_context
+def generate_pr(ctx, count, types, seed, title, base, auto_push, dry_run, github_repo, github_token, github_username, draft):
+    """Generate a new pull request with injected bugs."""
+    config = ctx.obj["config"]
+    language = config.get("language")
+
+    echo = Echo()
+    injection_engine = None
+
+    try:
+        echo(f"🚀 Generating PR with {count} bugs...")
+        echo(f"🌍 Language: {language}")
+        echo(f"🌿 Base branch: {base}")
+        echo(f"📤 Auto-push: {'Yes' if auto_push else 'No'}")
+        echo(f"🧪 Dry run: {'Yes' if dry_run else 'No'}")
+
+        if types:
+            echo(f"🐛 Bug types: {types}")
+        if seed is not None:
+            echo(f"🎲 Seed: {seed}")
+
+        if dry_run:
+            echo("🔍 DRY RUN MODE - No changes will be made")
+            echo("This would:")
+            echo("  1. Create a new branch")
+            echo("  2. Inject specified bugs")
+            echo("  3. Commit changes")
+            if auto_push:
+                echo("  4. Push branch and create PR")
+            return
+
+        # Import required components
+        import random
+        from datetime import datetime
+
+        from core.bug_injection import BugInjectionEngine
+        from core.git_operations import GitConfig
+        from core.pr_workflow import PRWorkflowConfig, PRWorkflowManager
+        from core.sampling import fast_sample
+        from core.template_cache import TemplateCache
+
+        # One generator drives both template sampling and target selection, so a
+        # seed reproduces the whole run without touching the global random state
+        rng = random.Random(seed)
+        if seed is not None:
+            echo(f"🎲 Using random seed: {seed}")
+
+        # Initialize workflow manager (for future use)
+        git_config = GitConfig(base_branch=base, branch_prefix="bug-injection")
+
+        # TODO: Use workflow_config for full PR workflow
+        # workflow_config = PRWorkflowConfig(auto_create_pr=auto_push, auto_push=auto_push)
+        # workflow_manager = PRWorkflowManager(
+        #     project_root=Path("."), git_config=git_config, workflow_config=workflow_config
+        # )
+
+        # Get available templates
+        echo.flush()
+        injection_engine = BugInjectionEngine(_CWD, template_cache=TemplateCache())
+        available_templates = injection_engine.get_available_templates(language)
+
+        if not available_templates:
+            echo(f"❌ No bug templates available for {language}")
+            return
+
+        echo(f"📋 Found {len(available_templates)} available bug templates")
+
+        # Filter templates by type if specified
+        selected_templates = available_templates
+        if types:
+            type_list = [t.strip() for t in types.split(",")]
+            type_set = frozenset(type_list)
+            # Ground truth records a template's category value as its bug type
+            selected_templates = [
+                t for t in available_templates if t.category.value in type_set
+            ]
+            echo(f"🎯 Filtered to {len(selected_templates)} templates of types: {type_list}")
+
+        if len(selected_templates) < count:
+            echo(
+                f"⚠️  Warning: Only {len(selected_templates)} templates available, reducing count"
+            )
+            count = len(selected_templates)
+
+        # Randomly select templates
+        selected_templates = fast_sample(selected_templates, count, rng)
+
+        # Start injection session
+        echo("🔧 Starting bug injection session...")
+        echo.flush()
+        session_id = injection_engine.start_injection_session(language)
+        short_id = session_id[:8]
+        echo(f"📝 Session ID: {session_id}")
+
+        # Inject bugs, collecting each modified file once in injection order.
+        # Per-bug detail is only printed with --verbose; otherwise a progress bar
+        # is shown and problems are reported once it finishes.
+        verbose = config.get("verbose")
+        detail = echo if verbose else (lambda message="": None)
+        issues = echo if verbose else Echo()
+        injected_bugs = []
+        files_modified = {}
+
+        echo.flush()
+        if verbose:
+            progress = contextlib.nullcontext(selected_templates)
+        else:
+            progress = click.progressbar(
+                selected_templates, label="🐛 Injecting bugs", show_pos=True
+            )
+
+        with progress as templates_to_inject:
+            for i, template in enumerate(templates_to_inject, 1):
+                detail(f"🐛 Injecting bug {i}/{count}: {template.name}")
+
+                # Find suitable injection targets
+                targets = injection_engine.find_injection_targets(template, language)
+                if not targets:
+                    issues(f"  ⚠️  No suitable targets found for {template.name}")
+                    continue
+
+                # Select random target
+                target = rng.choice(targets)
+                detail(f"  📍 Target: {target.file_path}:{target.line_number}")
+
+                # Inject the bug
+                injection_result = injection_engine.inject_bug(
+                    template.id, target.file_path, target.line_number
+                )
+
+                if injection_result.success:
+                    detail("  ✅ Successfully injected bug")
+                    injected_bugs.append(
+                        {"template": template, "target": target, "result": injection_result}
+                    )
+                    files_modified.update(
+                        dict.fromkeys(m.location.file_path for m in injection_result.modifications)
+                    )
+                else:
+                    issues(
+                        f"  ❌ Failed to inject bug ({template.name}): {injection_result.errors}"
+                    )
+
+        if not verbose:
+            issues.flush()
+
+        if not injected_bugs:
+            echo("❌ No bugs were successfully injected")
+            injection_engine.end_injection_session()
+            return
+
+        echo(f"🎉 Successfully injected {len(injected_bugs)} bugs!")
+
+        # Handle GitHub integration if specified
+        if github_repo:
+            echo("🚀 GitHub integration mode - Creating remote PR...")
+            echo.flush()
+            
+            try:
+                from core.github_integration import GitHubManager, GitHubWorkflow, create_github_config_from_cli
+                
+                # Initialize GitHub integration
+                github_config = create_github_config_from_cli(github_token, github_username)
+                github_manager = GitHubManager(github_config)
+                github_workflow = GitHubWorkflow(github_manager)
+                
+                # Prepare files for GitHub, reading each modified file once
+                files_to_update = {
+                    file_path: Path(file_path).read_text(encoding="utf-8")
+                    for file_path in files_modified
+                }
+                
+                # Create branch name
+                branch_name = f"bug-injection/{language}-{short_id}"
+                
+                # Prepare PR details
+                pr_title = title or f"Inject {len(injected_bugs)} bugs for testing ({short_id})"
+                pr_parts = [
+                    _PR_HEADER.format(
+                        count=len(injected_bugs),
+                        session_id=session_id,
+                        language=language,
+                        generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    )
+                ]
+                pr_parts.extend(
+                    _PR_BUG_ENTRY.format(
+                        i=i,
+                        name=bug['template'].name,
+                        category=bug['template'].category.value,
+                        file_path=bug['target'].file_path,
+                        line_number=bug['target'].line_number,
+                        severity=bug['template'].severity.value,
+                        difficulty=bug['template'].difficulty.value,
+                        description=bug['template'].description,
+                    )
+                    for i, bug in enumerate(injected_bugs, 1)
+                )
+                pr_parts.append(_PR_FOOTER)
+                pr_body = "".join(pr_parts)
+                
+                if not dry_run:
+                    # Create the PR on GitHub
+                    repo, pr = github_workflow.create_bug_injection_pr(
+                        repo_path=github_repo,
+                        base_branch=base,
+                        bug_branch=branch_name,
+                        files_to_update=files_to_update,
+                        pr_title=pr_title,
+                        pr_body=pr_body,
+                        draft=draft
+                    )
+                    
+                    echo(f"🎉 GitHub PR created successfully!")
+                    echo(f"🔗 PR URL: {pr.html_url}")
+                    echo(f"📊 PR Number: #{pr.number}")
+                    
+                else:
+                    echo("🔍 DRY RUN MODE - Would create GitHub PR:")
+                    echo(f"   Repository: {github_repo}")
+                    echo(f"   Branch: {branch_name}")
+                    echo(f"   Title: {pr_title}")
+                    echo(f"   Draft: {'Yes' if draft else 'No'}")
+                
+            except Exception as e:
+                echo(f"❌ GitHub integration failed: {e}")
+                echo("🔄 Falling back to local mode...")
+                # Continue with local workflow
+                github_repo = None
+
+        # Create local workflow
+        if auto_push and not github_repo:
+            echo("🚀 Creating PR workflow...")
+            echo.flush()
+
+            # For now, we'll create a simple branch and commit
+            # In a full implementation, this would use the PRWorkflowManager
+            from core.git_operations import GitOperations
+
+            git_ops = GitOperations(_CWD, git_config)
+
+            branch_name = f"bug-injection/{language}-{short_id}"
+            commit_message = f"feat: Inject {len(injected_bugs)} bugs for testing ({session_id})"
+            echo(f"🌿 Creating branch: {branch_name}")
+            echo(f"💾 Committing changes: {commit_message}")
+
+            if not dry_run:
+                # Branch, commit and push in a single git batch
+                echo.flush()
+                commit_hash, pushed = git_ops.publish_changes(
+                    branch_name, commit_message, list(files_modified), base_branch=base
+                )
+                echo(f"✅ Branch created: {branch_name}")
+                echo(f"✅ Changes committed: {commit_hash[:8]}")
+
+                if pushed:
+                    echo(f"📤 Branch pushed: {branch_name}")
+                else:
+                    echo(f"❌ Failed to push branch: {branch_name}")
+
+        # End session and export ground truth
+        echo("📊 Exporting ground truth data...")
+        echo.flush()
+        ground_truth_file = _GROUND_TRUTH_DIR / f"session_{session_id}.jsonl"
+        ground_truth_file.parent.mkdir(exist_ok=True)
+
+        injection_engine.export_ground_truth(ground_truth_file)
+        echo(f"✅ Ground truth exported to: {ground_truth_file}")
+
+        injection_engine.end_injection_session()
+
+        echo()
+        echo("🎉 Bug injection completed successfully!")
+        echo(f"📁 Ground truth file: {ground_truth_file}")
+        if auto_push:
+            echo(f"🌿 Branch: {branch_name}")
+            echo("📋 Next steps:")
+            echo("  1. Review the injected bugs")
+            echo("  2. Run your code review bot")
+            echo("  3. Use 'reviewlab evaluate' to measure accuracy")
+
+    except Exception as e:
+        echo.flush()
+        ErrorHandler.handle_error(e, "PR generation")
+        sys.exit(1)
+    finally:
+        # Bugs may already be in the source files; make sure their ground truth is written
+        if injection_engine is not None:
+            injection_engine.end_injection_session()
+        echo.flush()
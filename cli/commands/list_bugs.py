@@ -0,0 +1,143 @@
+"""
+List-bugs command for ReviewLab.
+"""
+
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import click
+
+from cli.output import Echo
+from core.errors import ErrorHandler
+
+_CWD = Path(".")
+_SEVERITY_EMOJI = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}
+_DIFFICULTY_EMOJI = {"easy": "🟢", "medium": "🟡", "hard": "🟠", "expert": "🔴"}
+
+
+@click.command()
+@click.option("--language", "-l", help="Target language (uses config default if not specified)")
+@click.option("--verbose", is_flag=True, help="Show detailed descriptions")
+@click.option("--category", "-c", help="Filter by bug category")
+@click.option("--severity", "-s", help="Filter by severity level")
+@click.option("--difficulty", "-d", help="Filter by difficulty level")
+@click.option(
+    "--format", default="table", type=click.Choice(["table", "json", "csv"]), help="Output format"
+)
+@click.pass_context
+def list_bugs(ctx, language, verbose, category, severity, difficulty, format):
+    """List available bug types for the current language."""
+    config = ctx.obj["config"]
+    target_language = language or config.get("language")
+
+    echo = Echo()
+
+    try:
+        echo(f"📋 Available bug types for {target_language}:")
+
+        # Import required components
+        from core.bug_injection import BugInjectionEngine
+        from core.template_cache import TemplateCache
+
+        # Initialize injection engine
+        injection_engine = BugInjectionEngine(_CWD, template_cache=TemplateCache())
+        available_templates = injection_engine.get_available_templates(target_language)
+
+        if not available_templates:
+            echo(f"❌ No bug templates available for {target_language}")
+            return
+
+        # Apply all filters in a single pass
+        if category:
+            echo(f"🎯 Filtered by category: {category}")
+        if severity:
+            echo(f"🎯 Filtered by severity: {severity}")
+        if difficulty:
+            echo(f"🎯 Filtered by difficulty: {difficulty}")
+
+        filtered_templates = [
+            t
+            for t in available_templates
+            if (not category or t.category.value == category)
+            and (not severity or t.severity.value == severity)
+            and (not difficulty or t.difficulty.value == difficulty)
+        ]
+
+        echo(f"📊 Found {len(filtered_templates)} templates")
+
+        if format == "json":
+            from core import json_utils
+
+            output_data = [
+                {
+                    "id": template.id,
+                    "name": template.name,
+                    "category": template.category.value,
+                    "severity": template.severity.value,
+                    "difficulty": template.difficulty.value,
+                    "description": template.description,
+                    "language": template.language,
+                }
+                for template in filtered_templates
+            ]
+            echo(json_utils.dumps(output_data, indent=True))
+
+        elif format == "csv":
+            import csv
+
+            # Stream rows straight to stdout after the buffered header lines
+            echo.flush()
+            stdout = click.get_text_stream("stdout")
+            writer = csv.writer(stdout)
+            writer.writerow(
+                ["ID", "Name", "Category", "Severity", "Difficulty", "Description", "Language"]
+            )
+            writer.writerows(
+                (
+                    template.id,
+                    template.name,
+                    template.category.value,
+                    template.severity.value,
+                    template.difficulty.value,
+                    template.description,
+                    template.language,
+                )
+                for template in filtered_templates
+            )
+            stdout.flush()
+
+        else:  # table format
+            # Group by category
+            categories = defaultdict(list)
+            for template in filtered_templates:
+                categories[template.category.value].append(template)
+
+            for cat, templates in categories.items():
+                echo(f"\n📁 {cat.upper()} ({len(templates)} templates):")
+                echo("-" * 50)
+
+                for template in templates:
+                    severity = template.severity.value
+                    difficulty = template.difficulty.value
+                    severity_emoji = _SEVERITY_EMOJI.get(severity, "⚪")
+                    difficulty_emoji = _DIFFICULTY_EMOJI.get(difficulty, "⚪")
+
+                    echo(f"  {severity_emoji} {difficulty_emoji} {template.name}")
+                    echo(f"     ID: {template.id}")
+                    echo(f"     Severity: {severity}")
+                    echo(f"     Difficulty: {difficulty}")
+
+                    if verbose:
+                        echo(f"     Description: {template.description}")
+                        echo(f"     Language: {template.language}")
+                    echo()
+
+        echo(f"🎯 Total: {len(filtered_templates)} bug templates available")
+
+    except Exception as e:
+        echo.flush()
+        ErrorHandler.handle_error(e, "Bug listing")
+        sys.exit(1)
+    finally:
+        echo.flush()
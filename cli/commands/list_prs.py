@@ -0,0 +1,70 @@
+"""
+List-PRs command for ReviewLab.
+"""
+
+import sys
+
+import click
+
+from core.errors import ErrorHandler
+
+
+@click.command()
+@click.option("--repo", required=True, help="GitHub repository (owner/repo or full URL)")
+@click.option("--github-token", help="GitHub Personal Access Token (or set GITHUB_TOKEN env var)")
+@click.option("--github-username", help="GitHub username (or set GITHUB_USERNAME env var)")
+@click.option("--state", default="open", type=click.Choice(["open", "closed", "all"]), help="PR state to list")
+@click.option("--base", help="Filter by base branch")
+@click.option("--limit", default=10, help="Maximum number of PRs to show")
+@click.pass_context
+def list_prs(ctx, repo, github_token, github_username, state, base, limit):
+    """List pull requests in a GitHub repository."""
+    try:
+        click.echo(f"🔍 Listing PRs in {repo}...")
+        
+        from core.github_integration import GitHubManager, create_github_config_from_cli
+        
+        # Initialize GitHub integration
+        github_config = create_github_config_from_cli(github_token, github_username)
+        github_manager = GitHubManager(github_config)
+        
+        # Get repository and PRs
+        repository = github_manager.get_repository(repo)
+        prs = github_manager.list_pull_requests(repository, state=state, base_branch=base)
+        
+        # Limit results
+        prs = prs[:limit]
+        
+        if not prs:
+            click.echo(f"📭 No {state} pull requests found")
+            if base:
+                click.echo(f"   Base branch filter: {base}")
+            return
+        
+        click.echo(f"📋 Found {len(prs)} {state} pull requests:")
+        click.echo()
+        
+        for pr in prs:
+            status_emoji = "🟢" if pr.state == "open" else "🔴"
+            draft_emoji = "📝" if pr.draft else ""
+            
+            click.echo(f"{status_emoji} #{pr.number} {draft_emoji} {pr.title}")
+            click.echo(f"   🔗 {pr.html_url}")
+            click.echo(f"   🌿 {pr.head.ref} → {pr.base.ref}")
+            click.echo(f"   👤 {pr.user.login}")
+            click.echo(f"   📅 {pr.created_at.strftime('%Y-%m-%d %H:%M')}")
+            click.echo()
+        
+        # Show repository info
+        repo_info = github_manager.get_repository_info(repository)
+        click.echo("📊 Repository Information:")
+        click.echo(f"   Name: {repo_info['name']}")
+        click.echo(f"   Owner: {repo_info['owner']}")
+        click.echo(f"   Language: {repo_info['language']}")
+        click.echo(f"   Stars: {repo_info['stars']}")
+        click.echo(f"   Forks: {repo_info['forks']}")
+        click.echo(f"   Open Issues: {repo_info['open_issues']}")
+        
+    except Exception as e:
+        ErrorHandler.handle_error(e, "PR listing")
+        sys.exit(1)
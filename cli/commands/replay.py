@@ -0,0 +1,33 @@
+"""
+Replay command for ReviewLab.
+"""
+
+import sys
+
+import click
+
+from core.errors import ErrorHandler
+
+
+@click.command()
+@click.option("--pr", required=True, help="PR to replay")
+@click.option("--output", type=click.Path(), help="Output directory for recreated changes")
+@click.pass_context
+def replay(ctx, pr, output):
+    """Rebuild exact bug mutations from ground truth log."""
+    # TODO: Use config for language-specific replay logic
+    # config = ctx.obj["config"]
+
+    try:
+        click.echo(f"🔄 Replaying PR {pr}...")
+
+        if output:
+            click.echo(f"📁 Output directory: {output}")
+
+        # TODO: Implement actual replay
+        click.echo("⚠️  Replay functionality not yet implemented")
+        click.echo("This would rebuild the exact bug mutations from the ground truth log.")
+
+    except Exception as e:
+        ErrorHandler.handle_error(e, "Replay")
+        sys.exit(1)
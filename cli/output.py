@@ -0,0 +1,58 @@
+"""
+Buffered console output for ReviewLab commands.
+"""
+
+from typing import Any, Iterable, List
+
+import click
+
+
+class Echo:
+    """Collects output lines and writes them with a single ``click.echo`` call.
+
+    Commands call ``echo(...)`` exactly like ``click.echo`` and ``flush()`` at
+    points where the user should see progress (before slow work, before error
+    handling, and on exit).
+    """
+
+    def __init__(self):
+        self.buffer: List[str] = []
+
+    def __call__(self, message: Any = "") -> None:
+        self.buffer.append(str(message))
+
+    def flush(self) -> None:
+        """Write all buffered lines at once."""
+        if self.buffer:
+            click.echo("\n".join(self.buffer))
+            self.buffer.clear()
+
+
+def format_evaluation_results(metrics: Any) -> str:
+    """Format the evaluation metrics summary as one multi-line string."""
+    return (
+        "📊 Evaluation Results:\n"
+        f"  🎯 Total Findings: {metrics.total_findings}\n"
+        f"  🎯 Total Ground Truth: {metrics.total_ground_truth}\n"
+        f"  ✅ True Positives: {metrics.true_positives}\n"
+        f"  ❌ False Positives: {metrics.false_positives}\n"
+        f"  ❌ False Negatives: {metrics.false_negatives}\n"
+        "\n"
+        f"  📈 Precision: {metrics.precision:.3f}\n"
+        f"  📈 Recall: {metrics.recall:.3f}\n"
+        f"  📈 F1-Score: {metrics.f1_score:.3f}\n"
+        f"  📈 Accuracy: {metrics.accuracy:.3f}"
+    )
+
+
+def format_match_details(matches: Iterable[Any]) -> str:
+    """Format the verbose per-match listing as one multi-line string."""
+    lines = ["🔍 Detailed Match Information:"]
+    lines.extend(
+        f"  {i}. {match.finding.file_path}:{match.finding.line_number}\n"
+        f"     Strategy: {match.match_strategy.value}\n"
+        f"     Confidence: {match.confidence:.3f}\n"
+        f"     Overlap Score: {match.overlap_score:.3f}"
+        for i, match in enumerate(matches, 1)
+    )
+    return "\n".join(lines)
@@ -7,20 +7,26 @@ enabling external tools and automated workflows to control the system.
 
 import os
 import logging
-import json
+import threading
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+import anyio
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 
 # Import our core modules
+from core import json_utils
 from core.bug_injection import BugInjectionEngine
 from core.github_integration import GitHubManager
-from core.evaluation import EvaluationEngine
+from core.evaluation import (
+    MATCH_STRATEGIES_BY_VALUE, EvaluationEngine, MatchStrategy, load_review_findings
+)
 from core.github_comments import GitHubCommentExtractor, GitHubRepositoryManager
 from core.models import BugTemplate, GroundTruthEntry
 
@@ -46,12 +52,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global instances (in production, use dependency injection)
-bug_engine = None
-github_integration = None
-evaluation_engine = None
-github_extractor = None
-repo_manager = None
+
+# Strategies used when a request names none (or only unknown ones)
+_DEFAULT_STRATEGIES = (
+    MatchStrategy.EXACT_OVERLAP,
+    MatchStrategy.LINE_RANGE_OVERLAP,
+    MatchStrategy.SEMANTIC_SIMILARITY,
+)
 
 
 # Import models from the models module
@@ -69,52 +76,155 @@ from core.models import (
 # Dependency Injection and Initialization
 # ============================================================================
 
+# Each factory is cached, so its instance is created on first use and shared
+# across requests. Failures (such as a missing token) are not cached.
+
+@lru_cache(maxsize=1)
 def get_bug_engine() -> BugInjectionEngine:
     """Get or create bug injection engine instance."""
-    global bug_engine
-    if bug_engine is None:
-        bug_engine = BugInjectionEngine()
-    return bug_engine
+    return BugInjectionEngine()
 
+def _require_github_token() -> str:
+    """Return GITHUB_TOKEN or raise a 500 if it is not configured."""
+    github_token = os.getenv('GITHUB_TOKEN')
+    if not github_token:
+        raise HTTPException(status_code=500, detail="GitHub token not configured")
+    return github_token
+
+@lru_cache(maxsize=1)
 def get_github_integration() -> GitHubManager:
     """Get or create GitHub integration instance."""
-    global github_integration
-    if github_integration is None:
-        github_token = os.getenv('GITHUB_TOKEN')
-        if not github_token:
-            raise HTTPException(status_code=500, detail="GitHub token not configured")
-        # Create a config object for GitHubManager
-        from core.github_integration import GitHubConfig
-        config = GitHubConfig(token=github_token)
-        github_integration = GitHubManager(config)
-    return github_integration
+    # Create a config object for GitHubManager
+    from core.github_integration import GitHubConfig
+    config = GitHubConfig(token=_require_github_token())
+    return GitHubManager(config)
 
+@lru_cache(maxsize=1)
 def get_evaluation_engine() -> EvaluationEngine:
     """Get or create evaluation engine instance."""
-    global evaluation_engine
-    if evaluation_engine is None:
-        evaluation_engine = EvaluationEngine()
-    return evaluation_engine
+    return EvaluationEngine()
+
+# Seconds extracted PR comments are reused before GitHub is asked again (0
+# disables the cache); tune with REVIEWLAB_COMMENT_CACHE_TTL.
+COMMENT_CACHE_TTL = float(
+    os.getenv('REVIEWLAB_COMMENT_CACHE_TTL', str(GitHubCommentExtractor.COMMENT_CACHE_TTL))
+)
 
+@lru_cache(maxsize=1)
 def get_github_extractor() -> GitHubCommentExtractor:
     """Get or create GitHub comment extractor instance."""
-    global github_extractor
-    if github_extractor is None:
-        github_token = os.getenv('GITHUB_TOKEN')
-        if not github_token:
-            raise HTTPException(status_code=500, detail="GitHub token not configured")
-        github_extractor = GitHubCommentExtractor(github_token)
-    return github_extractor
+    return GitHubCommentExtractor(_require_github_token(), cache_ttl=COMMENT_CACHE_TTL)
 
+@lru_cache(maxsize=1)
 def get_repo_manager() -> GitHubRepositoryManager:
     """Get or create repository manager instance."""
-    global repo_manager
-    if repo_manager is None:
-        github_token = os.getenv('GITHUB_TOKEN')
-        if not github_token:
-            raise HTTPException(status_code=500, detail="GitHub token not configured")
-        repo_manager = GitHubRepositoryManager(github_token)
-    return repo_manager
+    return GitHubRepositoryManager(_require_github_token())
+
+def reset_dependencies():
+    """Drop the cached dependency instances (e.g. after changing GITHUB_TOKEN)."""
+    for factory in (
+        get_bug_engine,
+        get_github_integration,
+        get_evaluation_engine,
+        get_github_extractor,
+        get_repo_manager,
+    ):
+        factory.cache_clear()
+
+# ============================================================================
+# Blocking I/O Helpers (run via run_in_threadpool from async endpoints)
+# ============================================================================
+
+def _read_json(path: str) -> Any:
+    """Read and decode a JSON file."""
+    with open(path, 'rb') as f:
+        return json_utils.loads(f.read())
+
+def _write_json(path: str, data: Any):
+    """Atomically write ``data`` as JSON to ``path``.
+
+    The content goes to a temporary file that is renamed over ``path``, so a
+    crash never leaves a truncated file. Parent directories are only created
+    when the first write into them fails.
+    """
+    content = json_utils.dumps(data, indent=True, default=str).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    try:
+        f = open(tmp_path, 'wb')
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(tmp_path, 'wb')
+    with f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+def _load_ground_truth(path: str) -> List[GroundTruthEntry]:
+    """Load ground truth entries, logging and skipping lines that fail to parse."""
+    # Read the JSONL file once and split on raw bytes
+    entries = []
+    raw = Path(path).read_bytes()
+    for line_num, line in enumerate(raw.splitlines(), 1):
+        if not line or line.isspace():
+            continue
+        try:
+            entries.append(GroundTruthEntry(**json_utils.loads(line)))
+        except Exception as e:
+            logger.warning(f"Failed to parse line {line_num}: {e}")
+    return entries
+
+
+class _ReportIndex:
+    """Index of report file names in a directory, keyed by session ID.
+
+    The directory is scanned once and rescanned only when its mtime changes, so
+    repeated lookups cost a single ``stat`` instead of a full listing.
+    """
+
+    def __init__(self, report_dir: str):
+        self.report_dir = report_dir
+        self._mtime_ns: Optional[int] = None
+        self._names: List[str] = []
+        self._by_session: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def find(self, session_id: str) -> List[str]:
+        """Return report file names containing ``session_id``.
+
+        Raises FileNotFoundError if the report directory does not exist.
+        """
+        mtime_ns = os.stat(self.report_dir).st_mtime_ns
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                with os.scandir(self.report_dir) as entries:
+                    self._names = [entry.name for entry in entries]
+                self._by_session.clear()
+                self._mtime_ns = mtime_ns
+
+            matches = self._by_session.get(session_id)
+            if matches is None:
+                matches = [name for name in self._names if session_id in name]
+                # Only remember hits so lookups of unknown IDs cannot grow the index
+                if matches:
+                    self._by_session[session_id] = matches
+            return matches
+
+
+evaluation_report_index = _ReportIndex("reports/evaluation_results")
+
+
+# PyGithub calls block for a full network round trip. They run on a separate
+# capacity limiter so slow GitHub requests cannot exhaust the shared threadpool
+# used for file I/O; tune with REVIEWLAB_GITHUB_CONCURRENCY.
+GITHUB_CONCURRENCY = int(os.getenv('REVIEWLAB_GITHUB_CONCURRENCY', '16'))
+_github_limiter: Optional[anyio.CapacityLimiter] = None
+
+async def _run_github_call(func, *args, **kwargs):
+    """Run a blocking GitHub SDK call in a worker thread under the GitHub limiter."""
+    global _github_limiter
+    if _github_limiter is None:
+        # Created lazily: older anyio releases need a running event loop
+        _github_limiter = anyio.CapacityLimiter(GITHUB_CONCURRENCY)
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=_github_limiter)
 
 
 # ============================================================================
@@ -174,7 +284,8 @@ async def inject_bugs(
         logger.info(f"Injecting bugs: {request.template_ids} into {request.project_path}")
         
         # Perform bug injection
-        injected_bugs = bug_engine.inject_bugs(
+        injected_bugs = await run_in_threadpool(
+            bug_engine.inject_bugs,
             template_ids=request.template_ids,
             project_path=request.project_path,
             language=request.language,
@@ -197,9 +308,7 @@ async def inject_bugs(
         
         # Save to file for now
         output_file = f"reports/injection_sessions/{session_id}.json"
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w') as f:
-            json.dump(results, f, default=str, indent=2)
+        await run_in_threadpool(_write_json, output_file, results)
         
         return BugInjectionResponse(
             session_id=session_id,
@@ -213,20 +322,20 @@ async def inject_bugs(
     except Exception as e:
         logger.error(f"Bug injection failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # The engine is shared across requests; persist any buffered ground truth
+        await run_in_threadpool(bug_engine.end_injection_session)
 
 @app.get("/api/v1/inject/sessions/{session_id}")
 async def get_injection_session(session_id: str):
     """Get details of a bug injection session."""
     try:
         session_file = f"reports/injection_sessions/{session_id}.json"
-        if not os.path.exists(session_file):
+        try:
+            return await run_in_threadpool(_read_json, session_file)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        with open(session_file, 'r') as f:
-            session_data = json.load(f)
-        
-        return session_data
-        
     except HTTPException:
         raise
     except Exception as e:
@@ -238,10 +347,10 @@ async def delete_injection_session(session_id: str):
     """Delete a bug injection session."""
     try:
         session_file = f"reports/injection_sessions/{session_id}.json"
-        if not os.path.exists(session_file):
+        try:
+            await run_in_threadpool(os.remove, session_file)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        os.remove(session_file)
         return {"message": f"Session {session_id} deleted successfully"}
         
     except HTTPException:
@@ -288,12 +397,17 @@ async def get_github_pr(
     pr_number: int,
     github_extractor: GitHubCommentExtractor = Depends(get_github_extractor)
 ):
-    """Get information about a GitHub PR."""
+    """Get information about a GitHub PR.
+
+    Comments may be up to COMMENT_CACHE_TTL seconds old (60 by default).
+    """
     try:
         # Get PR comments
-        comments = github_extractor.extract_pr_comments(owner, repo, pr_number)
+        comments = await _run_github_call(
+            github_extractor.extract_pr_comments, owner, repo, pr_number
+        )
         
-        return {
+        payload = {
             "pr_number": pr_number,
             "owner": owner,
             "repo": repo,
@@ -310,24 +424,32 @@ async def get_github_pr(
                 for c in comments
             ]
         }
+        # The payload is plain JSON types, so encode it directly rather than
+        # walking it again with jsonable_encoder
+        return Response(content=json_utils.dumps(payload), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Failed to get PR {pr_number}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/v1/github/prs/{owner}/{repo}/{pr_number}/comments")
+@app.get("/api/v1/github/prs/{owner}/{repo}/{pr_number}/comments", response_model=CommentExtractionResponse)
 async def get_pr_comments(
     owner: str,
     repo: str,
     pr_number: int,
     github_extractor: GitHubCommentExtractor = Depends(get_github_extractor)
 ):
-    """Extract and convert PR comments to findings."""
+    """Extract and convert PR comments to findings.
+
+    Comments may be up to COMMENT_CACHE_TTL seconds old (60 by default).
+    """
     try:
         logger.info(f"Extracting comments from PR #{pr_number}")
         
         # Extract comments
-        comments = github_extractor.extract_pr_comments(owner, repo, pr_number)
+        comments = await _run_github_call(
+            github_extractor.extract_pr_comments, owner, repo, pr_number
+        )
         
         # Convert to findings
         findings = github_extractor.map_comment_to_findings(comments)
@@ -338,13 +460,15 @@ async def get_pr_comments(
             cat = finding.category
             categories[cat] = categories.get(cat, 0) + 1
         
-        return CommentExtractionResponse(
-            pr_number=pr_number,
-            total_comments=len(comments),
-            findings=[finding.__dict__ for finding in findings],
-            categories=categories,
-            extraction_timestamp=datetime.now()
-        )
+        # Encode once with json_utils; the model above documents the response shape
+        payload = {
+            "pr_number": pr_number,
+            "total_comments": len(comments),
+            "findings": [finding.__dict__ for finding in findings],
+            "categories": categories,
+            "extraction_timestamp": datetime.now().isoformat(),
+        }
+        return Response(content=json_utils.dumps(payload), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Comment extraction failed: {e}")
@@ -364,59 +488,29 @@ async def evaluate_findings(
     try:
         logger.info(f"Evaluating findings: {request.findings_file}")
         
-        # Load review findings
-        with open(request.findings_file, "r") as f:
-            findings_data = json.load(f)
-
-        # Convert to ReviewFinding objects
-        from core.evaluation import FindingType, MatchStrategy, ReviewFinding
-        review_findings = []
-        for finding_data in findings_data:
-            finding = ReviewFinding(
-                id=finding_data.get("id", f"finding_{len(review_findings)}"),
-                file_path=finding_data["file_path"],
-                line_number=finding_data["line_number"],
-                end_line=finding_data.get("end_line"),
-                finding_type=FindingType(finding_data.get("finding_type", "bug")),
-                severity=finding_data.get("severity", "medium"),
-                confidence=finding_data.get("confidence", 0.8),
-                message=finding_data.get("message", ""),
-                rule_id=finding_data.get("rule_id"),
-                category=finding_data.get("category"),
-                metadata=finding_data.get("metadata", {}),
-            )
-            review_findings.append(finding)
-
-        # Load ground truth
-        ground_truth_entries = []
-        with open(request.ground_truth_file, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                if line.strip():
-                    try:
-                        data = json.loads(line)
-                        entry = GroundTruthEntry(**data)
-                        ground_truth_entries.append(entry)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse line {line_num}: {e}")
-                        continue
+        # Load review findings and ground truth off the event loop
+        review_findings = await run_in_threadpool(load_review_findings, request.findings_file)
+        ground_truth_entries = await run_in_threadpool(
+            _load_ground_truth, request.ground_truth_file
+        )
 
         # Convert strategy names to enum values
-        strategy_enums = []
-        for strategy_name in request.strategies or ["exact_overlap", "line_range_overlap", "semantic_similarity"]:
-            try:
-                strategy_enums.append(MatchStrategy(strategy_name))
-            except ValueError:
-                logger.warning(f"Unknown strategy '{strategy_name}', skipping")
+        strategy_names = request.strategies or ()
+        strategy_enums = [
+            MATCH_STRATEGIES_BY_VALUE[name]
+            for name in strategy_names
+            if name in MATCH_STRATEGIES_BY_VALUE
+        ]
+        unknown_strategies = [name for name in strategy_names if name not in MATCH_STRATEGIES_BY_VALUE]
+        if unknown_strategies:
+            logger.warning(f"Unknown strategies skipped: {', '.join(unknown_strategies)}")
 
         if not strategy_enums:
-            strategy_enums = [
-                MatchStrategy.EXACT_OVERLAP,
-                MatchStrategy.LINE_RANGE_OVERLAP,
-                MatchStrategy.SEMANTIC_SIMILARITY,
-            ]
+            strategy_enums = list(_DEFAULT_STRATEGIES)
 
         # Run evaluation
-        evaluation_result = evaluation_engine.evaluate_review(
+        evaluation_result = await run_in_threadpool(
+            evaluation_engine.evaluate_review,
             review_findings=review_findings,
             ground_truth_entries=ground_truth_entries,
             review_tool="API",
@@ -447,17 +541,13 @@ async def evaluate_findings(
 async def get_evaluation_report(session_id: str):
     """Get evaluation report for a session."""
     try:
-        # Look for evaluation reports
-        report_dir = f"reports/evaluation_results"
-        if not os.path.exists(report_dir):
+        # Look up evaluation reports matching the session ID
+        report_dir = evaluation_report_index.report_dir
+        try:
+            matching_files = await run_in_threadpool(evaluation_report_index.find, session_id)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="No evaluation reports found")
         
-        # Find files matching the session ID
-        matching_files = []
-        for file in os.listdir(report_dir):
-            if session_id in file:
-                matching_files.append(file)
-        
         if not matching_files:
             raise HTTPException(status_code=404, detail=f"No reports found for session {session_id}")
         
@@ -469,9 +559,14 @@ async def get_evaluation_report(session_id: str):
                 break
         
         if json_report:
+            # Stream the stored JSON as-is; FileResponse also sets ETag and Last-Modified.
+            # Stat it here so a report deleted since the directory scan is a 404.
             report_path = os.path.join(report_dir, json_report)
-            with open(report_path, 'r') as f:
-                return json.load(f)
+            try:
+                stat_result = await run_in_threadpool(os.stat, report_path)
+            except FileNotFoundError:
+                raise HTTPException(status_code=404, detail=f"No reports found for session {session_id}")
+            return FileResponse(report_path, media_type="application/json", stat_result=stat_result)
         else:
             return {"message": f"Reports found: {matching_files}", "session_id": session_id}
         
@@ -498,7 +593,8 @@ async def cleanup_repository(
         logger.info(f"Cleaning up repository {owner}/{repo}")
         
         # Perform cleanup
-        deleted_branches = repo_manager.cleanup_evaluation_branches(
+        deleted_branches = await _run_github_call(
+            repo_manager.cleanup_evaluation_branches,
             owner=owner,
             repo=repo,
             retention_days=request.retention_days
@@ -527,7 +623,7 @@ async def delete_branch(
     try:
         logger.info(f"Deleting branch {branch_name} from {owner}/{repo}")
         
-        success = repo_manager.delete_branch(owner, repo, branch_name)
+        success = await _run_github_call(repo_manager.delete_branch, owner, repo, branch_name)
         
         if success:
             return {"message": f"Branch {branch_name} deleted successfully"}
@@ -5,20 +5,23 @@ This module provides the core infrastructure for injecting bugs into baseline
 projects and maintaining ground truth logs of all injected bugs.
 """
 
-import json
+import sys
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Union
 
 from core.bug_templates import BugInjection, BugLocation, BugTemplate, BugTemplateManager
+from core.compat import DATACLASS_SLOTS
+from core import json_utils
 from core.errors import InjectionError
 from core.plugins import PluginManager
 from core.plugins.base import InjectionResult
+from core.template_cache import TemplateCache
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GroundTruthEntry:
     """Represents a ground truth entry for an injected bug."""
 
@@ -39,15 +42,31 @@ class GroundTruthEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return asdict(self)
+        """Convert to dictionary representation (``metadata`` is not copied)."""
+        return {
+            "id": self.id,
+            "injection_id": self.injection_id,
+            "template_id": self.template_id,
+            "project_path": self.project_path,
+            "language": self.language,
+            "file_path": self.file_path,
+            "line_number": self.line_number,
+            "bug_type": self.bug_type,
+            "description": self.description,
+            "severity": self.severity,
+            "difficulty": self.difficulty,
+            "injection_timestamp": self.injection_timestamp,
+            "original_code": self.original_code,
+            "modified_code": self.modified_code,
+            "metadata": self.metadata,
+        }
 
     def to_jsonl(self) -> str:
         """Convert to JSONL format."""
-        return json.dumps(self.to_dict())
+        return json_utils.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InjectionSession:
     """Represents a bug injection session."""
 
@@ -62,17 +81,75 @@ class InjectionSession:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return asdict(self)
+        """Convert to dictionary representation (``metadata`` is not copied)."""
+        return {
+            "session_id": self.session_id,
+            "project_path": self.project_path,
+            "language": self.language,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "total_injections": self.total_injections,
+            "successful_injections": self.successful_injections,
+            "failed_injections": self.failed_injections,
+            "metadata": self.metadata,
+        }
+
+
+# Categorical fields repeated across many ground truth entries
+_INTERNED_FIELDS = ("language", "file_path", "bug_type", "severity", "difficulty")
+
+
+def load_ground_truth_file(
+    path: Union[str, Path], on_error: Optional[Callable[[int, Exception], None]] = None
+) -> List[GroundTruthEntry]:
+    """Load ground truth entries from a JSONL file.
+
+    The file is read in one call and split on raw bytes. Repeated categorical
+    values such as file paths are interned so entries share one string object.
+    Lines that fail to parse are reported to ``on_error(line_number, exception)``
+    and skipped; if no callback is given the exception propagates.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    entries = []
+    for line_num, line in enumerate(raw.splitlines(), 1):
+        if not line or line.isspace():
+            continue
+        try:
+            data = json_utils.loads(line)
+            for key in _INTERNED_FIELDS:
+                value = data.get(key)
+                if type(value) is str:
+                    data[key] = sys.intern(value)
+            entries.append(GroundTruthEntry(**data))
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(line_num, e)
+
+    return entries
 
 
 class GroundTruthLogger:
-    """Manages ground truth logging for bug injections."""
+    """Manages ground truth logging for bug injections.
+
+    Logged entries are buffered per session and appended to the session's JSONL
+    file in one write by ``flush``, which runs automatically every
+    ``FLUSH_THRESHOLD`` entries, when the session ends and before the log is read.
+    Each flush opens, appends to and closes the file, so no handle outlives it.
+    """
+
+    FLUSH_THRESHOLD = 256
 
     def __init__(self, log_dir: Optional[Path] = None):
         self.log_dir = log_dir or Path("ground_truth")
         self.log_dir.mkdir(exist_ok=True)
         self.session_logs: Dict[str, InjectionSession] = {}
+        self._pending_writes: Dict[str, List[str]] = {}
+        # Injection counts per bug type and file path for each session, in first-seen order
+        self._bug_type_counts: Dict[str, Dict[str, int]] = {}
+        self._file_counts: Dict[str, Dict[str, int]] = {}
 
     def start_session(self, project_path: str, language: str) -> str:
         """Start a new injection session."""
@@ -88,6 +165,9 @@ class GroundTruthLogger:
 
     def end_session(self, session_id: str):
         """End an injection session."""
+        self.flush(session_id)
+        self._bug_type_counts.pop(session_id, None)
+        self._file_counts.pop(session_id, None)
         if session_id in self.session_logs:
             self.session_logs[session_id].end_time = datetime.now().isoformat()
 
@@ -106,7 +186,7 @@ class GroundTruthLogger:
 
         # Create ground truth entry
         entry = GroundTruthEntry(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             injection_id=injection.template_id,
             template_id=injection.template_id,
             project_path=session.project_path,
@@ -129,12 +209,17 @@ class GroundTruthLogger:
             },
         )
 
-        # Write to JSONL file
-        log_file = self.log_dir / f"{session_id}.jsonl"
-        with open(log_file, "a") as f:
-            f.write(entry.to_jsonl() + "\n")
+        # Buffer the JSONL line; flush() appends the batch to the session file
+        pending = self._pending_writes.setdefault(session_id, [])
+        pending.append(entry.to_jsonl() + "\n")
+        if len(pending) >= self.FLUSH_THRESHOLD:
+            self.flush(session_id)
 
         # Update session statistics
+        bug_type_counts = self._bug_type_counts.setdefault(session_id, {})
+        bug_type_counts[entry.bug_type] = bug_type_counts.get(entry.bug_type, 0) + 1
+        file_counts = self._file_counts.setdefault(session_id, {})
+        file_counts[entry.file_path] = file_counts.get(entry.file_path, 0) + 1
         session.total_injections += 1
         if result.success:
             session.successful_injections += 1
@@ -143,20 +228,32 @@ class GroundTruthLogger:
 
         return entry
 
+    def flush(self, session_id: str):
+        """Append buffered ground truth lines for a session to its JSONL file."""
+        pending = self._pending_writes.pop(session_id, None)
+        if not pending:
+            return
+
+        log_file = self.log_dir / f"{session_id}.jsonl"
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write("".join(pending))
+
+    def get_bug_type_counts(self, session_id: str) -> Dict[str, int]:
+        """Get injection counts per bug type for a session without reading its log."""
+        return dict(self._bug_type_counts.get(session_id, {}))
+
+    def get_file_counts(self, session_id: str) -> Dict[str, int]:
+        """Get injection counts per file path for a session without reading its log."""
+        return dict(self._file_counts.get(session_id, {}))
+
     def get_session_logs(self, session_id: str) -> List[GroundTruthEntry]:
         """Get all ground truth entries for a session."""
+        self.flush(session_id)
         log_file = self.log_dir / f"{session_id}.jsonl"
         if not log_file.exists():
             return []
 
-        entries = []
-        with open(log_file, "r") as f:
-            for line in f:
-                if line.strip():
-                    entry_data = json.loads(line)
-                    entries.append(GroundTruthEntry(**entry_data))
-
-        return entries
+        return load_ground_truth_file(log_file)
 
     def export_session_summary(self, session_id: str, output_file: Path):
         """Export a session summary to a file."""
@@ -181,16 +278,22 @@ class GroundTruthLogger:
             },
         }
 
-        with open(output_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        # Encode in one call and write once rather than streaming token by token
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(json_utils.dumps(summary, indent=True, default=str))
 
 
 class BugInjectionEngine:
     """Main engine for coordinating bug injection across languages."""
 
-    def __init__(self, project_root: Path, template_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        project_root: Path,
+        template_dir: Optional[Path] = None,
+        template_cache: Optional[TemplateCache] = None,
+    ):
         self.project_root = project_root
-        self.template_manager = BugTemplateManager(template_dir)
+        self.template_manager = BugTemplateManager(template_dir, cache=template_cache)
         self.plugin_manager = PluginManager(project_root)
         self.ground_truth_logger = GroundTruthLogger()
         self.current_session: Optional[str] = None
@@ -261,16 +364,8 @@ class BugInjectionEngine:
         if not self.current_session:
             raise InjectionError("No active injection session")
 
-        # Get available templates
-        templates = self.template_manager.get_templates_by_language(language)
-
-        # Filter by categories if specified
-        if categories:
-            templates = [t for t in templates if t.category.value in categories]
-
-        # Filter by difficulties if specified
-        if difficulties:
-            templates = [t for t in templates if t.difficulty.value in difficulties]
+        # Get available templates, filtered by categories and difficulties if specified
+        templates = self.template_manager.get_filtered(language, categories, difficulties)
 
         if not templates:
             raise InjectionError(f"No templates available for language: {language}")
@@ -285,13 +380,21 @@ class BugInjectionEngine:
         results = []
         import random
 
+        # Injection targets per file and template id. A file's entries are dropped
+        # after an injection into it because its contents and line numbers change.
+        targets_cache: Dict[Any, Dict[str, List[Any]]] = {}
+
         for _ in range(count):
             # Select random template and file
             template = random.choice(templates)
             source_file = random.choice(source_files)
 
             # Find injection targets
-            targets = plugin.find_injection_targets(source_file, template)
+            file_targets = targets_cache.setdefault(source_file, {})
+            targets = file_targets.get(template.id)
+            if targets is None:
+                targets = plugin.find_injection_targets(source_file, template)
+                file_targets[template.id] = targets
             if not targets:
                 continue
 
@@ -306,9 +409,11 @@ class BugInjectionEngine:
                 metadata={"random_injection": True},
             )
 
-            # Perform injection
-            result = self.plugin_manager.inject_bug(injection)
+            # Perform injection; source_file came from this plugin, so skip the
+            # PluginManager's per-file language detection
+            result = plugin.inject_bug(injection)
             results.append(result)
+            targets_cache.pop(source_file, None)
 
             # Log to ground truth
             self.ground_truth_logger.log_injection(
@@ -339,7 +444,8 @@ class BugInjectionEngine:
             return {"error": "No active session"}
 
         session = self.ground_truth_logger.session_logs[self.current_session]
-        entries = self.ground_truth_logger.get_session_logs(self.current_session)
+        bug_type_counts = self.ground_truth_logger.get_bug_type_counts(self.current_session)
+        file_counts = self.ground_truth_logger.get_file_counts(self.current_session)
 
         return {
             "session_id": self.current_session,
@@ -354,8 +460,10 @@ class BugInjectionEngine:
                 if session.total_injections > 0
                 else 0
             ),
-            "bug_types": list(set(entry.bug_type for entry in entries)),
-            "files_modified": list(set(entry.file_path for entry in entries)),
+            "bug_types": list(bug_type_counts),
+            "files_modified": list(file_counts),
+            "bug_type_counts": bug_type_counts,
+            "file_counts": file_counts,
         }
 
     def export_ground_truth(self, output_file: Path):
@@ -375,12 +483,8 @@ class BugInjectionEngine:
         self, language: str, category: Optional[str] = None, difficulty: Optional[str] = None
     ) -> List[BugTemplate]:
         """Get available bug templates with optional filtering."""
-        templates = self.template_manager.get_templates_by_language(language)
-
-        if category:
-            templates = [t for t in templates if t.category.value == category]
-
-        if difficulty:
-            templates = [t for t in templates if t.difficulty.value == difficulty]
-
-        return templates
+        return self.template_manager.get_filtered(
+            language,
+            categories=[category] if category else None,
+            difficulties=[difficulty] if difficulty else None,
+        )
@@ -10,11 +10,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import yaml
 
+from core.compat import DATACLASS_SLOTS, YAML_LOADER
 from core.errors import InjectionError
+from core.template_cache import TemplateCache
 
 
 class BugSeverity(Enum):
@@ -45,7 +47,26 @@ class BugCategory(Enum):
     TEST_ISSUES = "test_issues"
 
 
-@dataclass
+# Value -> member tables, so template loading avoids going through Enum.__call__
+SEVERITIES_BY_VALUE: Dict[str, BugSeverity] = {s.value: s for s in BugSeverity}
+DIFFICULTIES_BY_VALUE: Dict[str, BugDifficulty] = {d.value: d for d in BugDifficulty}
+CATEGORIES_BY_VALUE: Dict[str, BugCategory] = {c.value: c for c in BugCategory}
+
+
+def _parse_enum(table: Dict[str, Enum], enum_cls: type, value: Any) -> Any:
+    """Resolve ``value`` through ``table``, raising ValueError like ``enum_cls(value)``."""
+    try:
+        return table[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
+def _members(table: Dict[str, Enum], values: Iterable[str]) -> Tuple[Enum, ...]:
+    """Map enum values to their members, ignoring unknown values."""
+    return tuple({table[value] for value in values if value in table})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BugLocation:
     """Represents the location where a bug should be injected."""
 
@@ -68,7 +89,7 @@ class BugLocation:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BugTemplate:
     """Base class for bug injection templates."""
 
@@ -101,7 +122,7 @@ class BugTemplate:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BugInjection:
     """Represents a specific bug injection instance."""
 
@@ -147,19 +168,49 @@ class BugTemplateEngine(ABC):
 class BugTemplateManager:
     """Manages bug templates across different languages and categories."""
 
-    def __init__(self, template_dir: Optional[Path] = None):
+    def __init__(self, template_dir: Optional[Path] = None, cache: Optional[TemplateCache] = None):
         self.template_dir = template_dir or Path("tooling/bug_templates")
         self.templates: Dict[str, BugTemplate] = {}
         self.taxonomy: Dict[str, Any] = {}
-        self._load_taxonomy()
-        self._load_templates()
+        self.cache = cache
+
+        state = self.cache.load(self.template_dir) if self.cache is not None else None
+        if state is not None:
+            self.templates = state["templates"]
+            self.taxonomy = state["taxonomy"]
+        else:
+            self._load_taxonomy()
+            self._load_templates()
+
+            if self.cache is not None:
+                self.cache.store(
+                    self.template_dir, {"templates": self.templates, "taxonomy": self.taxonomy}
+                )
+
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Group the loaded templates by language, category, severity and difficulty."""
+        # Lowercased name, description and tags, so searches do not re-lower them
+        self._search_text: List[Tuple[BugTemplate, Tuple[str, ...]]] = []
+        self._by_language: Dict[str, List[BugTemplate]] = {}
+        self._by_category: Dict[BugCategory, List[BugTemplate]] = {}
+        self._by_severity: Dict[BugSeverity, List[BugTemplate]] = {}
+        self._by_difficulty: Dict[BugDifficulty, List[BugTemplate]] = {}
+        for template in self.templates.values():
+            texts = (template.name, template.description, *template.tags)
+            self._search_text.append((template, tuple(text.lower() for text in texts)))
+            self._by_language.setdefault(template.language, []).append(template)
+            self._by_category.setdefault(template.category, []).append(template)
+            self._by_severity.setdefault(template.severity, []).append(template)
+            self._by_difficulty.setdefault(template.difficulty, []).append(template)
 
     def _load_taxonomy(self):
         """Load the bug taxonomy definition."""
         taxonomy_file = self.template_dir / "bug_taxonomy.yaml"
         if taxonomy_file.exists():
             with open(taxonomy_file, "r") as f:
-                self.taxonomy = yaml.safe_load(f)
+                self.taxonomy = yaml.load(f, Loader=YAML_LOADER)
 
     def _load_templates(self):
         """Load all bug templates from the template directory."""
@@ -176,7 +227,7 @@ class BugTemplateManager:
         for template_file in lang_dir.glob("*.yaml"):
             try:
                 with open(template_file, "r") as f:
-                    template_data = yaml.safe_load(f)
+                    template_data = yaml.load(f, Loader=YAML_LOADER)
                     if isinstance(template_data, list):
                         for item in template_data:
                             template = self._create_template_from_dict(item, lang_dir.name)
@@ -198,9 +249,15 @@ class BugTemplateManager:
                 id=data.get("id", ""),
                 name=data.get("name", ""),
                 description=data.get("description", ""),
-                category=BugCategory(data.get("category", "correctness")),
-                severity=BugSeverity(data.get("severity", "medium")),
-                difficulty=BugDifficulty(data.get("difficulty", "medium")),
+                category=_parse_enum(
+                    CATEGORIES_BY_VALUE, BugCategory, data.get("category", "correctness")
+                ),
+                severity=_parse_enum(
+                    SEVERITIES_BY_VALUE, BugSeverity, data.get("severity", "medium")
+                ),
+                difficulty=_parse_enum(
+                    DIFFICULTIES_BY_VALUE, BugDifficulty, data.get("difficulty", "medium")
+                ),
                 language=language,
                 patterns=data.get("patterns", []),
                 tags=data.get("tags", []),
@@ -217,34 +274,48 @@ class BugTemplateManager:
 
     def get_templates_by_category(self, category: BugCategory) -> List[BugTemplate]:
         """Get templates filtered by category."""
-        return [t for t in self.templates.values() if t.category == category]
+        return list(self._by_category.get(category, ()))
 
     def get_templates_by_language(self, language: str) -> List[BugTemplate]:
         """Get templates filtered by language."""
-        return [t for t in self.templates.values() if t.language == language]
+        return list(self._by_language.get(language, ()))
 
     def get_templates_by_severity(self, severity: BugSeverity) -> List[BugTemplate]:
         """Get templates filtered by severity."""
-        return [t for t in self.templates.values() if t.severity == severity]
+        return list(self._by_severity.get(severity, ()))
 
     def get_templates_by_difficulty(self, difficulty: BugDifficulty) -> List[BugTemplate]:
         """Get templates filtered by difficulty."""
-        return [t for t in self.templates.values() if t.difficulty == difficulty]
+        return list(self._by_difficulty.get(difficulty, ()))
+
+    def get_filtered(
+        self,
+        language: str,
+        categories: Optional[Iterable[str]] = None,
+        difficulties: Optional[Iterable[str]] = None,
+    ) -> List[BugTemplate]:
+        """Get templates for a language, optionally limited to category and difficulty values.
+
+        Templates keep their load order, so seeded random selection is stable.
+        """
+        templates = self._by_language.get(language, [])
+        # Compare enum members by identity rather than reading .value per template
+        if categories:
+            wanted_categories = _members(CATEGORIES_BY_VALUE, categories)
+            templates = [t for t in templates if t.category in wanted_categories]
+        if difficulties:
+            wanted_difficulties = _members(DIFFICULTIES_BY_VALUE, difficulties)
+            templates = [t for t in templates if t.difficulty in wanted_difficulties]
+        return list(templates)
 
     def search_templates(self, query: str) -> List[BugTemplate]:
         """Search templates by name, description, or tags."""
         query_lower = query.lower()
-        results = []
-
-        for template in self.templates.values():
-            if (
-                query_lower in template.name.lower()
-                or query_lower in template.description.lower()
-                or any(query_lower in tag.lower() for tag in template.tags)
-            ):
-                results.append(template)
-
-        return results
+        return [
+            template
+            for template, texts in self._search_text
+            if any(query_lower in text for text in texts)
+        ]
 
     def get_taxonomy(self) -> Dict[str, Any]:
         """Get the bug taxonomy definition."""
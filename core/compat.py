@@ -0,0 +1,14 @@
+"""
+Python version and library build compatibility helpers for ReviewLab.
+"""
+
+import sys
+
+import yaml
+
+# Slotted dataclasses drop the per-instance __dict__ (supported on Python 3.10+).
+# Use as ``@dataclass(**DATACLASS_SLOTS)``.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
@@ -8,15 +8,43 @@ Handles loading configuration from multiple sources:
 4. CLI arguments (highest priority)
 """
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
+from core.compat import YAML_LOADER
 from core.errors import ConfigurationError
 
 
+# Parsed config files by resolved path, with the (mtime_ns, size) they were parsed at
+_YAML_CACHE: Dict[str, Tuple[int, int, Any]] = {}
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    Set ``REVIEWLAB_YAML_CACHE=0`` to always re-parse.
+    """
+    if os.environ.get("REVIEWLAB_YAML_CACHE", "1") == "0":
+        with open(path, "rb") as f:
+            return yaml.load(f, Loader=YAML_LOADER)
+
+    st = path.stat()
+    cache_key = str(path.resolve())
+    cached = _YAML_CACHE.get(cache_key)
+    if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+        # Hand libyaml the raw bytes; it decodes UTF-8 itself
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
+        cached = _YAML_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, data)
+
+    # Callers merge the result into mutable config, so never hand out the cached copy
+    return copy.deepcopy(cached[2])
+
+
 class ConfigManager:
     """Manages configuration with hierarchical override system."""
 
@@ -122,8 +150,7 @@ class ConfigManager:
             if not config_path.exists():
                 raise ConfigurationError(f"Configuration file not found: {config_path}")
 
-            with open(config_path, "r", encoding="utf-8") as f:
-                file_config = yaml.safe_load(f)
+            file_config = _load_yaml_file(config_path)
 
             if file_config:
                 self._merge_config(file_config)
@@ -7,12 +7,15 @@ code review bot accuracy against ground truth data.
 
 import json
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
+from core.compat import DATACLASS_SLOTS
+from core import json_utils
 from core.models import GroundTruthEntry
 from core.errors import EvaluationError
 
@@ -38,7 +41,20 @@ class FindingType(Enum):
     OTHER = "other"
 
 
-@dataclass
+# Value -> member tables, so hot loops avoid going through Enum.__call__
+MATCH_STRATEGIES_BY_VALUE: Dict[str, MatchStrategy] = {s.value: s for s in MatchStrategy}
+FINDING_TYPES_BY_VALUE: Dict[str, FindingType] = {t.value: t for t in FindingType}
+
+
+def parse_finding_type(value: str) -> FindingType:
+    """Resolve a finding type value, raising ValueError like ``FindingType(value)``."""
+    try:
+        return FINDING_TYPES_BY_VALUE[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid FindingType") from None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ReviewFinding:
     """Represents a finding from a code review bot."""
 
@@ -71,6 +87,42 @@ class ReviewFinding:
         }
 
 
+def _intern_str(value: Any) -> Any:
+    """Intern ``value`` if it is a string; other values (e.g. None) pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def load_review_findings(path: Union[str, Path]) -> List[ReviewFinding]:
+    """Load review findings from a JSON array of finding objects.
+
+    The file is decoded in one call and each object becomes a ``ReviewFinding``
+    with the dataclass defaults for missing keys. File paths and severities are
+    interned since the same few values repeat across findings.
+    """
+    with open(path, "rb") as f:
+        findings_data = json_utils.loads(f.read())
+
+    default_type = FindingType.BUG
+    return [
+        ReviewFinding(
+            id=d.get("id", f"finding_{i}"),
+            file_path=_intern_str(d["file_path"]),
+            line_number=d["line_number"],
+            end_line=d.get("end_line"),
+            finding_type=(
+                parse_finding_type(d["finding_type"]) if "finding_type" in d else default_type
+            ),
+            severity=_intern_str(d.get("severity", "medium")),
+            confidence=d.get("confidence", 0.8),
+            message=d.get("message", ""),
+            rule_id=d.get("rule_id"),
+            category=d.get("category"),
+            metadata=d.get("metadata", {}),
+        )
+        for i, d in enumerate(findings_data)
+    ]
+
+
 @dataclass
 class MatchResult:
     """Result of matching a review finding to ground truth."""
@@ -152,6 +204,21 @@ class EvaluationResult:
         }
 
 
+def _file_key(item: Any) -> str:
+    """File path of a finding or ground truth entry."""
+    return item.file_path
+
+
+def _directory_key(item: Any) -> Path:
+    """Parent directory of a finding or ground truth entry."""
+    return Path(item.file_path).parent
+
+
+def _stem_key(item: Any) -> str:
+    """File name stem of a finding or ground truth entry."""
+    return Path(item.file_path).stem
+
+
 class EvaluationEngine:
     """Main engine for evaluating code review bot accuracy."""
 
@@ -164,6 +231,14 @@ class EvaluationEngine:
             MatchStrategy.BREADCRUMB_MATCHING: self._breadcrumb_match,
             MatchStrategy.FUZZY_MATCHING: self._fuzzy_match,
         }
+        # Strategies that only match a finding and ground truth entry sharing this
+        # key; ground truth is bucketed by it so each finding scans only its bucket
+        self.candidate_keys: Dict[MatchStrategy, Callable[[Any], Any]] = {
+            MatchStrategy.EXACT_OVERLAP: _file_key,
+            MatchStrategy.LINE_RANGE_OVERLAP: _file_key,
+            MatchStrategy.BREADCRUMB_MATCHING: _directory_key,
+            MatchStrategy.FUZZY_MATCHING: _stem_key,
+        }
 
     def evaluate_review(
         self,
@@ -244,11 +319,19 @@ class EvaluationEngine:
         matches = []
         matcher = self.match_strategies[strategy]
 
+        key = self.candidate_keys.get(strategy)
+        if key is not None:
+            # Buckets keep ground truth order, so the first match found is unchanged
+            buckets: Dict[Any, List[GroundTruthEntry]] = {}
+            for gt in ground_truth:
+                buckets.setdefault(key(gt), []).append(gt)
+
         for finding in findings:
             if finding.id in matched_findings:
                 continue
 
-            for gt in ground_truth:
+            candidates = ground_truth if key is None else buckets.get(key(finding), ())
+            for gt in candidates:
                 if gt.id in matched_ground_truth:
                     continue
 
@@ -531,9 +614,11 @@ class EvaluationEngine:
         # Match breakdown
         report.append("MATCH BREAKDOWN:")
         report.append("-" * 20)
-        for strategy in MatchStrategy:
-            strategy_matches = [m for m in result.matches if m.match_strategy == strategy]
-            report.append(f"{strategy.value}: {len(strategy_matches)} matches")
+        strategy_counts = {strategy: 0 for strategy in MatchStrategy}
+        for match in result.matches:
+            strategy_counts[match.match_strategy] += 1
+        for strategy, count in strategy_counts.items():
+            report.append(f"{strategy.value}: {count} matches")
 
         report.append("")
         report.append("=" * 60)
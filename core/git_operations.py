@@ -226,6 +226,58 @@ class GitOperations:
         result = self._run_git_command(command)
         return result.returncode == 0
 
+    # Checkout, stage, commit and (optionally) push in one shell process.
+    # Values are passed as positional parameters so nothing is re-quoted.
+    _PUBLISH_SCRIPT = (
+        'set -e; branch="$1"; base="$2"; message="$3"; remote="$4"; push="$5"; shift 5; '
+        'git checkout -q -b "$branch" "$base"; '
+        'if [ "$#" -gt 0 ]; then git add -- "$@"; fi; '
+        'git commit -q -m "$message"; '
+        "git rev-parse HEAD; "
+        'if [ "$push" = 1 ]; then git push -q -u "$remote" "$branch" || exit 3; fi'
+    )
+
+    def publish_changes(
+        self,
+        branch_name: str,
+        message: str,
+        files: Optional[List[str]] = None,
+        base_branch: Optional[str] = None,
+        push: bool = True,
+    ) -> Tuple[str, bool]:
+        """Create a branch, commit ``files`` to it and push it in a single subprocess.
+
+        Returns ``(commit_hash, pushed)``. Failing to create the branch or commit
+        raises GitError; a failed push is reported through ``pushed``.
+        """
+        base = base_branch or self.config.base_branch
+        command = [
+            "sh",
+            "-c",
+            self._PUBLISH_SCRIPT,
+            "sh",
+            branch_name,
+            base,
+            message,
+            self.config.remote_name,
+            "1" if push else "0",
+        ] + list(files or [])
+
+        try:
+            result = subprocess.run(
+                command, cwd=self.repo_path, capture_output=True, text=True, timeout=120
+            )
+        except subprocess.TimeoutExpired:
+            raise GitError(f"Publishing branch timed out: {branch_name}")
+        except Exception as e:
+            raise GitError(f"Failed to run Git command: {e}")
+
+        commit_hash = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+        if result.returncode not in (0, 3) or not commit_hash:
+            raise GitError(f"Failed to publish branch {branch_name}: {result.stderr}")
+
+        return commit_hash, push and result.returncode == 0
+
     def get_remote_url(self) -> Optional[str]:
         """Get the remote repository URL."""
         result = self._run_git_command(["remote", "get-url", self.config.remote_name])
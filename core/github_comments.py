@@ -9,14 +9,75 @@ This module provides functionality to:
 
 import json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from github import Github, PullRequest, IssueComment
 import requests
 
+from core.errors import GitHubError
+
 logger = logging.getLogger(__name__)
 
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Fetches PR comments, review comments and review summaries in one request
+PR_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      comments(first: 100) {
+        pageInfo { hasNextPage }
+        nodes { databaseId author { login } body createdAt updatedAt }
+      }
+      reviews(first: 100) {
+        pageInfo { hasNextPage }
+        nodes {
+          databaseId author { login } body submittedAt
+          comments(first: 100) {
+            pageInfo { hasNextPage }
+            nodes {
+              databaseId author { login } body createdAt updatedAt
+              path line diffHunk position commit { oid }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Return ``value`` as a timezone-aware UTC datetime (naive values are taken as UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_github_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO 8601 timestamp such as ``2024-01-01T12:00:00Z``."""
+    if value is None:
+        return None
+    return _as_utc(datetime.fromisoformat(value.replace("Z", "+00:00")))
+
+
+def _author_login(node: Dict[str, Any]) -> str:
+    """Return the author login of a GraphQL node (``ghost`` for deleted users)."""
+    author = node.get("author")
+    return author["login"] if author else "ghost"
+
+
+def _user_login(user: Any) -> str:
+    """Return the login of a PyGithub user (``ghost`` for deleted users)."""
+    return user.login if user is not None else "ghost"
+
 
 @dataclass
 class Comment:
@@ -62,9 +123,19 @@ class BranchStatus:
 
 class GitHubCommentExtractor:
     """Extract and parse GitHub PR comments."""
+
+    # Extracted comments are reused for this many seconds so clients polling a
+    # PR do not spend a GitHub request on every call; 0 disables the cache
+    COMMENT_CACHE_TTL = 60.0
+    COMMENT_CACHE_SIZE = 128
     
-    def __init__(self, github_token: str):
+    def __init__(self, github_token: str, cache_ttl: Optional[float] = None):
         """Initialize with GitHub token."""
+        self.cache_ttl = self.COMMENT_CACHE_TTL if cache_ttl is None else cache_ttl
+        self._comment_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[Comment]]]" = (
+            OrderedDict()
+        )
+        self._comment_cache_lock = threading.Lock()
         self.github = Github(github_token)
         self.session = requests.Session()
         self.session.headers.update({
@@ -73,59 +144,180 @@ class GitHubCommentExtractor:
         })
     
     def extract_pr_comments(self, owner: str, repo: str, pr_number: int) -> List[Comment]:
-        """Extract all comments from a specific PR."""
+        """Extract all comments from a specific PR.
+
+        A single GraphQL query covers PRs with up to 100 comments, reviews and
+        comments per review; larger PRs fall back to the paginated REST API.
+        """
+        key = (owner, repo, pr_number)
+        cached = self._get_cached_comments(key)
+        if cached is not None:
+            return cached
+
         try:
-            # Get the repository and PR
-            repo_obj = self.github.get_repo(f"{owner}/{repo}")
-            pr = repo_obj.get_pull(pr_number)
-            
-            comments = []
-            
-            # Get general PR comments
-            for comment in pr.get_issue_comments():
-                comments.append(Comment(
-                    id=comment.id,
-                    author=comment.user.login,
-                    body=comment.body,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    comment_type='general'
-                ))
-            
-            # Get review comments (line-specific)
-            for comment in pr.get_review_comments():
-                comments.append(Comment(
-                    id=comment.id,
-                    author=comment.user.login,
-                    body=comment.body,
-                    created_at=comment.created_at,
-                    updated_at=comment.updated_at,
-                    comment_type='line',
-                    file_path=comment.path,
-                    line_number=comment.line,
-                    commit_id=comment.commit_id,
-                    diff_hunk=comment.diff_hunk,
-                    position=comment.position
-                ))
-            
-            # Get review summaries
-            for review in pr.get_reviews():
-                if review.body:  # Only add if there's actual content
-                    comments.append(Comment(
-                        id=review.id,
-                        author=review.user.login,
-                        body=review.body,
-                        created_at=review.submitted_at,
-                        updated_at=review.submitted_at,
-                        comment_type='review'
-                    ))
-            
+            comments = self._extract_pr_comments_graphql(owner, repo, pr_number)
+            if comments is None:
+                comments = self._extract_pr_comments_rest(owner, repo, pr_number)
+
             logger.info(f"Extracted {len(comments)} comments from PR #{pr_number}")
+            self._store_cached_comments(key, comments)
             return comments
             
         except Exception as e:
             logger.error(f"Error extracting comments from PR #{pr_number}: {e}")
             raise
+
+    def _get_cached_comments(self, key: Tuple[str, str, int]) -> Optional[List[Comment]]:
+        """Return a copy of the cached comments for ``key`` if still fresh."""
+        if self.cache_ttl <= 0:
+            return None
+        with self._comment_cache_lock:
+            entry = self._comment_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, comments = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._comment_cache[key]
+                return None
+            self._comment_cache.move_to_end(key)
+            return list(comments)
+
+    def _store_cached_comments(self, key: Tuple[str, str, int], comments: List[Comment]):
+        """Cache ``comments`` for ``key``, evicting the least recently used entry."""
+        if self.cache_ttl <= 0:
+            return
+        with self._comment_cache_lock:
+            self._comment_cache[key] = (time.monotonic(), list(comments))
+            self._comment_cache.move_to_end(key)
+            if len(self._comment_cache) > self.COMMENT_CACHE_SIZE:
+                self._comment_cache.popitem(last=False)
+
+    def _extract_pr_comments_graphql(
+        self, owner: str, repo: str, pr_number: int
+    ) -> Optional[List[Comment]]:
+        """Fetch PR comments with one GraphQL request.
+
+        Returns None if any connection has more than one page of results.
+        """
+        response = self.session.post(
+            GITHUB_GRAPHQL_URL,
+            json={
+                "query": PR_COMMENTS_QUERY,
+                "variables": {"owner": owner, "name": repo, "number": pr_number},
+            },
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise GitHubError(f"GraphQL query failed: {payload['errors'][0].get('message')}")
+
+        pr = payload["data"]["repository"]["pullRequest"]
+        if pr is None:
+            raise GitHubError(f"Pull request #{pr_number} not found in {owner}/{repo}")
+
+        issue_comments = pr["comments"]
+        reviews = pr["reviews"]
+        if (
+            issue_comments["pageInfo"]["hasNextPage"]
+            or reviews["pageInfo"]["hasNextPage"]
+            or any(r["comments"]["pageInfo"]["hasNextPage"] for r in reviews["nodes"])
+        ):
+            return None
+
+        # Same order as the REST path: general, line-specific, then review summaries
+        comments = [
+            Comment(
+                id=node["databaseId"],
+                author=_author_login(node),
+                body=node["body"],
+                created_at=_parse_github_datetime(node["createdAt"]),
+                updated_at=_parse_github_datetime(node["updatedAt"]),
+                comment_type='general'
+            )
+            for node in issue_comments["nodes"]
+        ]
+        comments.extend(
+            Comment(
+                id=node["databaseId"],
+                author=_author_login(node),
+                body=node["body"],
+                created_at=_parse_github_datetime(node["createdAt"]),
+                updated_at=_parse_github_datetime(node["updatedAt"]),
+                comment_type='line',
+                file_path=node["path"],
+                line_number=node["line"],
+                commit_id=(node.get("commit") or {}).get("oid"),
+                diff_hunk=node["diffHunk"],
+                position=node["position"]
+            )
+            for review in reviews["nodes"]
+            for node in review["comments"]["nodes"]
+        )
+        comments.extend(
+            Comment(
+                id=review["databaseId"],
+                author=_author_login(review),
+                body=review["body"],
+                created_at=_parse_github_datetime(review["submittedAt"]),
+                updated_at=_parse_github_datetime(review["submittedAt"]),
+                comment_type='review'
+            )
+            for review in reviews["nodes"]
+            if review["body"]  # Only add if there's actual content
+        )
+        return comments
+
+    def _extract_pr_comments_rest(self, owner: str, repo: str, pr_number: int) -> List[Comment]:
+        """Fetch PR comments through the paginated REST API.
+
+        Timestamps are normalised to timezone-aware UTC, matching the GraphQL path.
+        """
+        # Get the repository and PR
+        repo_obj = self.github.get_repo(f"{owner}/{repo}")
+        pr = repo_obj.get_pull(pr_number)
+        
+        comments = []
+        
+        # Get general PR comments
+        for comment in pr.get_issue_comments():
+            comments.append(Comment(
+                id=comment.id,
+                author=_user_login(comment.user),
+                body=comment.body,
+                created_at=_as_utc(comment.created_at),
+                updated_at=_as_utc(comment.updated_at),
+                comment_type='general'
+            ))
+        
+        # Get review comments (line-specific)
+        for comment in pr.get_review_comments():
+            comments.append(Comment(
+                id=comment.id,
+                author=_user_login(comment.user),
+                body=comment.body,
+                created_at=_as_utc(comment.created_at),
+                updated_at=_as_utc(comment.updated_at),
+                comment_type='line',
+                file_path=comment.path,
+                line_number=comment.line,
+                commit_id=comment.commit_id,
+                diff_hunk=comment.diff_hunk,
+                position=comment.position
+            ))
+        
+        # Get review summaries
+        for review in pr.get_reviews():
+            if review.body:  # Only add if there's actual content
+                comments.append(Comment(
+                    id=review.id,
+                    author=_user_login(review.user),
+                    body=review.body,
+                    created_at=_as_utc(review.submitted_at),
+                    updated_at=_as_utc(review.submitted_at),
+                    comment_type='review'
+                ))
+        
+        return comments
     
     def parse_comment_content(self, comment: Comment) -> ReviewFinding:
         """Convert a GitHub comment to a ReviewLab finding."""
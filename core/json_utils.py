@@ -0,0 +1,31 @@
+"""
+JSON helpers for ReviewLab.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+``json`` module otherwise, so callers never need to care which one is active.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize a JSON document from ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize ``obj`` to a JSON string, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None, default=default)
@@ -6,15 +6,19 @@ analysis, and insights for code review bot evaluation results.
 """
 
 import csv
-import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from core import json_utils
 from core.errors import EvaluationError
 from core.evaluation import EvaluationResult, GroundTruthEntry, MatchResult, ReviewFinding
 
+# Buffer size for report files; large reports otherwise take many small writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class ReportConfig:
@@ -37,28 +41,69 @@ class ReportGenerator:
         self.reports_dir = Path("reports")
         self.reports_dir.mkdir(exist_ok=True)
 
+    def build_payload(self, evaluation_result: EvaluationResult) -> Dict[str, Any]:
+        """Walk an evaluation result once into the primitives every format renders.
+
+        The payload does not depend on the output format, so it can be built once
+        and passed to ``generate_comprehensive_report`` for each format.
+        """
+        result = evaluation_result
+        match_stats = self._collect_match_stats(result)
+        match_breakdown = match_stats["match_breakdown"]
+
+        return {
+            "metrics": result.metrics.to_dict(),
+            "match_rate": (
+                len(result.matches) / result.metrics.total_ground_truth
+                if result.metrics.total_ground_truth > 0
+                else 0
+            ),
+            "match_breakdown": match_breakdown,
+            "detailed_analysis": self._generate_detailed_analysis(result, match_stats),
+            "insights": self._generate_performance_insights(result, match_breakdown),
+            "recommendations": self._generate_recommendations(result),
+            "matches": [match.to_dict() for match in result.matches],
+            "unmatched_findings": [f.to_dict() for f in result.unmatched_findings],
+            "unmatched_ground_truth": [gt.to_dict() for gt in result.unmatched_ground_truth],
+        }
+
     def generate_comprehensive_report(
-        self, evaluation_result: EvaluationResult, output_file: Optional[Path] = None
+        self,
+        evaluation_result: EvaluationResult,
+        output_file: Optional[Path] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        output_format: Optional[str] = None,
     ) -> Path:
-        """Generate a comprehensive evaluation report."""
+        """Generate a comprehensive evaluation report.
+
+        ``payload`` may be a value previously returned by ``build_payload`` for the
+        same result; it is built on demand otherwise. ``output_format`` overrides
+        the configured format for this call, so one generator can render several.
+        """
+        output_format = output_format or self.config.output_format
+
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = (
-                self.reports_dir / f"evaluation_report_{timestamp}.{self.config.output_format}"
-            )
+            output_file = self.reports_dir / f"evaluation_report_{timestamp}.{output_format}"
+
+        if output_format not in ("json", "csv", "txt", "html"):
+            raise EvaluationError(f"Unsupported output format: {output_format}")
 
-        if self.config.output_format == "json":
-            return self._generate_json_report(evaluation_result, output_file)
-        elif self.config.output_format == "csv":
-            return self._generate_csv_report(evaluation_result, output_file)
-        elif self.config.output_format == "txt":
-            return self._generate_text_report(evaluation_result, output_file)
-        elif self.config.output_format == "html":
-            return self._generate_html_report(evaluation_result, output_file)
+        if payload is None:
+            payload = self.build_payload(evaluation_result)
+
+        if output_format == "json":
+            return self._generate_json_report(evaluation_result, output_file, payload)
+        elif output_format == "csv":
+            return self._generate_csv_report(evaluation_result, output_file, payload)
+        elif output_format == "txt":
+            return self._generate_text_report(evaluation_result, output_file, payload)
         else:
-            raise EvaluationError(f"Unsupported output format: {self.config.output_format}")
+            return self._generate_html_report(evaluation_result, output_file, payload)
 
-    def _generate_json_report(self, result: EvaluationResult, output_file: Path) -> Path:
+    def _generate_json_report(
+        self, result: EvaluationResult, output_file: Path, payload: Dict[str, Any]
+    ) -> Path:
         """Generate a JSON report."""
         report_data = {
             "report_info": {
@@ -68,41 +113,32 @@ class ReportGenerator:
                 "review_tool": result.review_tool,
             },
             "summary": {
-                "metrics": result.metrics.to_dict(),
-                "total_matches": len(result.matches),
-                "match_rate": (
-                    len(result.matches) / result.metrics.total_ground_truth
-                    if result.metrics.total_ground_truth > 0
-                    else 0
-                ),
+                "metrics": payload["metrics"],
+                "total_matches": len(payload["matches"]),
+                "match_rate": payload["match_rate"],
             },
-            "detailed_analysis": self._generate_detailed_analysis(result),
-            "matches": (
-                [match.to_dict() for match in result.matches]
-                if self.config.include_detailed_matches
-                else []
-            ),
+            "detailed_analysis": payload["detailed_analysis"],
+            "matches": payload["matches"] if self.config.include_detailed_matches else [],
             "unmatched_findings": (
-                [f.to_dict() for f in result.unmatched_findings]
-                if self.config.include_unmatched_items
-                else []
+                payload["unmatched_findings"] if self.config.include_unmatched_items else []
             ),
             "unmatched_ground_truth": (
-                [gt.to_dict() for gt in result.unmatched_ground_truth]
-                if self.config.include_unmatched_items
-                else []
+                payload["unmatched_ground_truth"] if self.config.include_unmatched_items else []
             ),
             "metadata": result.metadata if self.config.include_metadata else {},
         }
 
-        with open(output_file, "w") as f:
-            json.dump(report_data, f, indent=2)
+        # orjson (when installed) encodes the whole report in C; str() covers the rest
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(json_utils.dumps(report_data, indent=True, default=str))
 
         return output_file
 
-    def _generate_csv_report(self, result: EvaluationResult, output_file: Path) -> Path:
+    def _generate_csv_report(
+        self, result: EvaluationResult, output_file: Path, payload: Dict[str, Any]
+    ) -> Path:
         """Generate a CSV report."""
-        with open(output_file, "w", newline="") as f:
+        with open(output_file, "w", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
 
             # Write header
@@ -144,7 +180,7 @@ class ReportGenerator:
             )
 
             # Write matches if requested
-            if self.config.include_detailed_matches and result.matches:
+            if self.config.include_detailed_matches and payload["matches"]:
                 writer.writerow([])  # Empty row for separation
                 writer.writerow(
                     [
@@ -159,23 +195,25 @@ class ReportGenerator:
                     ]
                 )
 
-                for match in result.matches:
-                    writer.writerow(
-                        [
-                            match.finding.id,
-                            match.finding.id,
-                            match.ground_truth.id,
-                            match.match_strategy.value,
-                            f"{match.confidence:.4f}",
-                            f"{match.overlap_score:.4f}",
-                            match.finding.file_path,
-                            match.finding.line_number,
-                        ]
+                writer.writerows(
+                    (
+                        match["finding"]["id"],
+                        match["finding"]["id"],
+                        match["ground_truth_id"],
+                        match["match_strategy"],
+                        f"{match['confidence']:.4f}",
+                        f"{match['overlap_score']:.4f}",
+                        match["finding"]["file_path"],
+                        match["finding"]["line_number"],
                     )
+                    for match in payload["matches"]
+                )
 
         return output_file
 
-    def _generate_text_report(self, result: EvaluationResult, output_file: Path) -> Path:
+    def _generate_text_report(
+        self, result: EvaluationResult, output_file: Path, payload: Dict[str, Any]
+    ) -> Path:
         """Generate a text report."""
         report_lines = []
 
@@ -192,7 +230,7 @@ class ReportGenerator:
         report_lines.append("EXECUTIVE SUMMARY")
         report_lines.append("-" * 40)
         report_lines.append(
-            f"Overall Performance: {self._get_performance_rating(result.metrics.f1_score)}"
+            f"Overall Performance: {payload['detailed_analysis']['performance_rating']}"
         )
         report_lines.append(f"F1-Score: {result.metrics.f1_score:.3f}")
         report_lines.append(f"Precision: {result.metrics.precision:.3f}")
@@ -213,24 +251,21 @@ class ReportGenerator:
         # Match Analysis
         report_lines.append("MATCH ANALYSIS")
         report_lines.append("-" * 40)
-        match_breakdown = self._get_match_breakdown(result.matches)
-        for strategy, count in match_breakdown.items():
+        for strategy, count in payload["match_breakdown"].items():
             report_lines.append(f"{strategy}: {count} matches")
         report_lines.append("")
 
         # Performance Insights
         report_lines.append("PERFORMANCE INSIGHTS")
         report_lines.append("-" * 40)
-        insights = self._generate_performance_insights(result)
-        for insight in insights:
+        for insight in payload["insights"]:
             report_lines.append(f"• {insight}")
         report_lines.append("")
 
         # Recommendations
         report_lines.append("RECOMMENDATIONS")
         report_lines.append("-" * 40)
-        recommendations = self._generate_recommendations(result)
-        for rec in recommendations:
+        for rec in payload["recommendations"]:
             report_lines.append(f"• {rec}")
         report_lines.append("")
 
@@ -244,7 +279,9 @@ class ReportGenerator:
 
         return output_file
 
-    def _generate_html_report(self, result: EvaluationResult, output_file: Path) -> Path:
+    def _generate_html_report(
+        self, result: EvaluationResult, output_file: Path, payload: Dict[str, Any]
+    ) -> Path:
         """Generate an HTML report."""
         html_content = f"""
 <!DOCTYPE html>
@@ -317,12 +354,12 @@ class ReportGenerator:
         
         <div class="section">
             <h2 class="section-title">Performance Insights</h2>
-            {self._generate_html_insights(result)}
+            {self._generate_html_insights(payload["insights"])}
         </div>
         
         <div class="section">
             <h2 class="section-title">Recommendations</h2>
-            {self._generate_html_recommendations(result)}
+            {self._generate_html_recommendations(payload["recommendations"])}
         </div>
     </div>
 </body>
@@ -334,15 +371,20 @@ class ReportGenerator:
 
         return output_file
 
-    def _generate_detailed_analysis(self, result: EvaluationResult) -> Dict[str, Any]:
+    def _generate_detailed_analysis(
+        self, result: EvaluationResult, match_stats: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
         """Generate detailed analysis of the evaluation results."""
+        if match_stats is None:
+            match_stats = self._collect_match_stats(result)
+
         analysis = {
             "performance_rating": self._get_performance_rating(result.metrics.f1_score),
             "strengths": self._identify_strengths(result),
             "weaknesses": self._identify_weaknesses(result),
-            "match_breakdown": self._get_match_breakdown(result.matches),
-            "file_analysis": self._analyze_file_performance(result),
-            "severity_analysis": self._analyze_severity_performance(result),
+            "match_breakdown": match_stats["match_breakdown"],
+            "file_analysis": match_stats["file_analysis"],
+            "severity_analysis": match_stats["severity_analysis"],
         }
 
         return analysis
@@ -388,6 +430,45 @@ class ReportGenerator:
             breakdown[strategy] = breakdown.get(strategy, 0) + 1
         return breakdown
 
+    def _collect_match_stats(self, result: EvaluationResult) -> Dict[str, Dict[str, Any]]:
+        """Compute the strategy, file and severity breakdowns in one pass.
+
+        Walks the matches and the unmatched findings once instead of once per
+        breakdown, which matters for results with many matches.
+        """
+        breakdown: Dict[str, int] = {}
+        file_stats: Dict[str, Dict[str, int]] = {}
+        severity_stats: Dict[str, Dict[str, int]] = {}
+
+        for match in result.matches:
+            strategy = match.match_strategy.value
+            breakdown[strategy] = breakdown.get(strategy, 0) + 1
+            finding = match.finding
+            stats = file_stats.get(finding.file_path)
+            if stats is None:
+                stats = file_stats[finding.file_path] = {"matches": 0, "total_findings": 0}
+            stats["matches"] += 1
+            stats = severity_stats.get(finding.severity)
+            if stats is None:
+                stats = severity_stats[finding.severity] = {"matches": 0, "total_findings": 0}
+            stats["matches"] += 1
+
+        for finding in result.unmatched_findings:
+            stats = file_stats.get(finding.file_path)
+            if stats is None:
+                stats = file_stats[finding.file_path] = {"matches": 0, "total_findings": 0}
+            stats["total_findings"] += 1
+            stats = severity_stats.get(finding.severity)
+            if stats is None:
+                stats = severity_stats[finding.severity] = {"matches": 0, "total_findings": 0}
+            stats["total_findings"] += 1
+
+        return {
+            "match_breakdown": breakdown,
+            "file_analysis": file_stats,
+            "severity_analysis": severity_stats,
+        }
+
     def _identify_strengths(self, result: EvaluationResult) -> List[str]:
         """Identify strengths in the evaluation results."""
         strengths = []
@@ -420,41 +501,15 @@ class ReportGenerator:
 
     def _analyze_file_performance(self, result: EvaluationResult) -> Dict[str, Any]:
         """Analyze performance by file."""
-        file_stats = {}
-
-        for match in result.matches:
-            file_path = match.finding.file_path
-            if file_path not in file_stats:
-                file_stats[file_path] = {"matches": 0, "total_findings": 0}
-            file_stats[file_path]["matches"] += 1
-
-        for finding in result.unmatched_findings:
-            file_path = finding.file_path
-            if file_path not in file_stats:
-                file_stats[file_path] = {"matches": 0, "total_findings": 0}
-            file_stats[file_path]["total_findings"] += 1
-
-        return file_stats
+        return self._collect_match_stats(result)["file_analysis"]
 
     def _analyze_severity_performance(self, result: EvaluationResult) -> Dict[str, Any]:
         """Analyze performance by severity level."""
-        severity_stats = {}
-
-        for match in result.matches:
-            severity = match.finding.severity
-            if severity not in severity_stats:
-                severity_stats[severity] = {"matches": 0, "total_findings": 0}
-            severity_stats[severity]["matches"] += 1
-
-        for finding in result.unmatched_findings:
-            severity = finding.severity
-            if severity not in severity_stats:
-                severity_stats[severity] = {"matches": 0, "total_findings": 0}
-            severity_stats[severity]["total_findings"] += 1
+        return self._collect_match_stats(result)["severity_analysis"]
 
-        return severity_stats
-
-    def _generate_performance_insights(self, result: EvaluationResult) -> List[str]:
+    def _generate_performance_insights(
+        self, result: EvaluationResult, match_breakdown: Optional[Dict[str, int]] = None
+    ) -> List[str]:
         """Generate performance insights."""
         insights = []
 
@@ -469,7 +524,8 @@ class ReportGenerator:
             )
 
         # Match strategy insights
-        match_breakdown = self._get_match_breakdown(result.matches)
+        if match_breakdown is None:
+            match_breakdown = self._get_match_breakdown(result.matches)
         if "exact_overlap" in match_breakdown and match_breakdown["exact_overlap"] > 0:
             insights.append(
                 f"Exact overlap matching found {match_breakdown['exact_overlap']} high-confidence matches"
@@ -503,18 +559,50 @@ class ReportGenerator:
 
         return recommendations
 
-    def _generate_html_insights(self, result: EvaluationResult) -> str:
+    def _generate_html_insights(self, insights: List[str]) -> str:
         """Generate HTML for insights section."""
-        insights = self._generate_performance_insights(result)
-        html = ""
-        for insight in insights:
-            html += f'<div class="insight">{insight}</div>'
-        return html
+        return "".join(f'<div class="insight">{insight}</div>' for insight in insights)
 
-    def _generate_html_recommendations(self, result: EvaluationResult) -> str:
+    def _generate_html_recommendations(self, recommendations: List[str]) -> str:
         """Generate HTML for recommendations section."""
-        recommendations = self._generate_recommendations(result)
-        html = ""
-        for rec in recommendations:
-            html += f'<div class="recommendation">{rec}</div>'
-        return html
+        return "".join(f'<div class="recommendation">{rec}</div>' for rec in recommendations)
+
+
+def generate_reports(
+    evaluation_result: EvaluationResult,
+    targets: List[Tuple[str, Path]],
+    payload: Optional[Dict[str, Any]] = None,
+    **config_options: Any,
+) -> List[Path]:
+    """Render ``(output_format, output_file)`` targets concurrently.
+
+    A single generator renders every format from one shared payload in a
+    thread pool; the payload is built once here unless one is passed in.
+    Report files are returned in the order of ``targets``; the first
+    rendering error is re-raised.
+    """
+    if not targets:
+        return []
+
+    generator = ReportGenerator(ReportConfig(**config_options))
+    if payload is None:
+        payload = generator.build_payload(evaluation_result)
+
+    if len(targets) == 1:
+        fmt, output_file = targets[0]
+        return [
+            generator.generate_comprehensive_report(evaluation_result, output_file, payload, fmt)
+        ]
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        futures = [
+            executor.submit(
+                generator.generate_comprehensive_report,
+                evaluation_result,
+                output_file,
+                payload,
+                fmt,
+            )
+            for fmt, output_file in targets
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,40 @@
+"""
+Sampling helpers for ReviewLab.
+
+Bug generation usually picks a handful of templates out of a much larger
+pool. ``fast_sample`` avoids ``random.sample``'s per-call set/pool allocation
+for that case.
+"""
+
+import math
+import random
+from bisect import bisect_left
+from typing import Any, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def fast_sample(population: Sequence[T], k: int, rng: Optional[Any] = None) -> List[T]:
+    """Return ``k`` distinct elements chosen from ``population``.
+
+    For ``k < sqrt(n)`` this uses insertion sampling: ``k`` distinct indices are
+    drawn with ``randrange`` and kept in a sorted list, so the result follows
+    population order. Larger samples fall back to ``random.sample``. For a given
+    seed the insertion path draws a different selection than ``random.sample``.
+    """
+    rng = rng or random
+    n = len(population)
+    if k < 0 or k > n:
+        raise ValueError("Sample larger than population or is negative")
+
+    if k >= math.isqrt(n):
+        return rng.sample(list(population), k)
+
+    indices: List[int] = []
+    while len(indices) < k:
+        index = rng.randrange(n)
+        position = bisect_left(indices, index)
+        if position == len(indices) or indices[position] != index:
+            indices.insert(position, index)
+
+    return [population[i] for i in indices]
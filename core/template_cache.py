@@ -0,0 +1,91 @@
+"""
+Persistent template cache for ReviewLab.
+
+Parsing the bug template YAML files dominates the runtime of short-lived CLI
+commands such as ``list-bugs``. This module stores the parsed templates and
+taxonomy in a pickle file under the user cache directory and reuses it for as
+long as the template files on disk are unchanged.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core import __version__
+
+CACHE_FORMAT_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Return the ReviewLab cache directory (``$XDG_CACHE_HOME/reviewlab``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "reviewlab"
+
+
+class TemplateCache:
+    """Pickle-backed cache of parsed bug templates keyed on template file stats."""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = cache_file or default_cache_dir() / f"state-v{CACHE_FORMAT_VERSION}.pkl"
+
+    def compute_key(self, template_dir: Path) -> Tuple[Any, ...]:
+        """Build a cache key from the version and the stats of every template file."""
+        stats = []
+        if template_dir.exists():
+            for path in sorted(template_dir.rglob("*.yaml")):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                stats.append((str(path), st.st_mtime_ns, st.st_size))
+        return (__version__, CACHE_FORMAT_VERSION, str(template_dir.resolve()), tuple(stats))
+
+    def load(self, template_dir: Path) -> Optional[Dict[str, Any]]:
+        """Return the cached state for ``template_dir`` or None if stale or missing."""
+        try:
+            with open(self.cache_file, "rb") as f:
+                entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        if not isinstance(entries, dict):
+            return None
+
+        entry = entries.get(str(template_dir.resolve()))
+        if not entry or entry.get("key") != self.compute_key(template_dir):
+            return None
+        return entry.get("state")
+
+    def store(self, template_dir: Path, state: Dict[str, Any]):
+        """Persist ``state`` for ``template_dir``; failures are silently ignored."""
+        entries: Dict[str, Any] = {}
+        try:
+            with open(self.cache_file, "rb") as f:
+                loaded = pickle.load(f)
+            if isinstance(loaded, dict):
+                entries = loaded
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+
+        entries[str(template_dir.resolve())] = {
+            "key": self.compute_key(template_dir),
+            "state": state,
+        }
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    def clear(self) -> bool:
+        """Remove the cache file. Returns True if a file was removed."""
+        try:
+            self.cache_file.unlink()
+            return True
+        except FileNotFoundError:
+            return False
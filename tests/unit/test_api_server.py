@@ -0,0 +1,185 @@
+"""
+Unit tests for the API server helpers and endpoints.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+
+import core.api_server as api_server
+from core.api_server import (
+    _ReportIndex,
+    _run_github_call,
+    _write_json,
+    get_evaluation_engine,
+    get_evaluation_report,
+    reset_dependencies,
+)
+
+
+class TestWriteJson:
+    """Test atomic JSON writes."""
+
+    def test_creates_parent_directories(self, tmp_path):
+        """Missing parent directories are created on the first write."""
+        path = tmp_path / "a" / "b" / "out.json"
+
+        _write_json(str(path), {"x": 1})
+
+        assert json.loads(path.read_text()) == {"x": 1}
+        assert os.listdir(path.parent) == ["out.json"]
+
+    def test_writes_temp_file_then_replaces(self, tmp_path):
+        """Content goes to a temp file that is renamed over the target."""
+        path = tmp_path / "out.json"
+        path.write_text("old")
+
+        with patch("core.api_server.os.replace", wraps=os.replace) as mock_replace:
+            _write_json(str(path), {"x": 2})
+
+        mock_replace.assert_called_once_with(f"{path}.tmp", str(path))
+        assert json.loads(path.read_text()) == {"x": 2}
+        assert not (tmp_path / "out.json.tmp").exists()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        """A failure before the rename leaves the existing file untouched."""
+        path = tmp_path / "out.json"
+        path.write_text('{"x": 1}')
+
+        with patch("core.api_server.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _write_json(str(path), {"x": 2})
+
+        assert json.loads(path.read_text()) == {"x": 1}
+
+
+class TestDependencies:
+    """Test the cached dependency factories."""
+
+    def test_reset_dependencies_discards_cached_instances(self):
+        """Factories return one shared instance until reset_dependencies() is called."""
+        reset_dependencies()
+        first = get_evaluation_engine()
+        assert get_evaluation_engine() is first
+
+        reset_dependencies()
+
+        assert get_evaluation_engine() is not first
+        reset_dependencies()
+
+
+class TestRunGitHubCall:
+    """Test running blocking GitHub calls under the capacity limiter."""
+
+    def test_runs_in_worker_thread(self, monkeypatch):
+        """The call runs off the event loop thread and its result is returned."""
+        monkeypatch.setattr(api_server, "_github_limiter", None)
+        loop_thread = threading.get_ident()
+
+        def call(a, b=0):
+            return threading.get_ident(), a + b
+
+        thread_id, result = asyncio.run(_run_github_call(call, 1, b=2))
+
+        assert result == 3
+        assert thread_id != loop_thread
+
+    def test_concurrency_is_limited(self, monkeypatch):
+        """No more than GITHUB_CONCURRENCY calls run at once."""
+        monkeypatch.setattr(api_server, "GITHUB_CONCURRENCY", 2)
+        monkeypatch.setattr(api_server, "_github_limiter", None)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def call():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.05)
+            with lock:
+                state["running"] -= 1
+
+        async def main():
+            await asyncio.gather(*(_run_github_call(call) for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert state["peak"] == 2
+        assert api_server._github_limiter.total_tokens == 2
+
+
+class TestReportIndex:
+    """Test the mtime-keyed report index."""
+
+    def test_repeated_lookup_is_memoized(self, tmp_path):
+        """A second lookup with an unchanged directory reuses the first scan and result."""
+        (tmp_path / "eval_s1.json").write_text("{}")
+        index = _ReportIndex(str(tmp_path))
+
+        with patch("core.api_server.os.scandir", wraps=os.scandir) as mock_scandir:
+            first = index.find("s1")
+            second = index.find("s1")
+
+        assert first == ["eval_s1.json"]
+        assert second is first
+        assert mock_scandir.call_count == 1
+
+    def test_rescans_when_directory_mtime_changes(self, tmp_path):
+        """Adding a report changes the directory mtime and triggers a rescan."""
+        (tmp_path / "eval_s1.json").write_text("{}")
+        index = _ReportIndex(str(tmp_path))
+        assert index.find("s1") == ["eval_s1.json"]
+        assert index.find("s2") == []
+
+        (tmp_path / "eval_s2.json").write_text("{}")
+        st = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert index.find("s2") == ["eval_s2.json"]
+
+    def test_missing_directory_raises(self, tmp_path):
+        """A missing report directory surfaces as FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            _ReportIndex(str(tmp_path / "missing")).find("s1")
+
+
+class TestGetEvaluationReport:
+    """Test serving evaluation reports."""
+
+    def test_serves_report_file(self, tmp_path, monkeypatch):
+        """A matching JSON report is streamed with a FileResponse."""
+        (tmp_path / "eval_s1.json").write_text('{"ok": true}')
+        monkeypatch.setattr(api_server, "evaluation_report_index", _ReportIndex(str(tmp_path)))
+
+        response = asyncio.run(get_evaluation_report("s1"))
+
+        assert isinstance(response, FileResponse)
+        assert response.path == os.path.join(str(tmp_path), "eval_s1.json")
+        assert response.media_type == "application/json"
+
+    def test_report_deleted_after_scan_is_404(self, tmp_path, monkeypatch):
+        """A report listed by the index but gone from disk is a 404, not a 500."""
+        index = _ReportIndex(str(tmp_path))
+        monkeypatch.setattr(index, "find", lambda session_id: ["eval_s1.json"])
+        monkeypatch.setattr(api_server, "evaluation_report_index", index)
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_evaluation_report("s1"))
+        assert exc_info.value.status_code == 404
+
+    def test_missing_report_directory_is_404(self, tmp_path, monkeypatch):
+        """No report directory at all is a 404."""
+        monkeypatch.setattr(
+            api_server, "evaluation_report_index", _ReportIndex(str(tmp_path / "missing"))
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(get_evaluation_report("s1"))
+        assert exc_info.value.status_code == 404
@@ -2,8 +2,11 @@
 Unit tests for the bug injection engine.
 """
 
+import json
 import shutil
+import sys
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,11 +17,32 @@ from core.bug_injection import (
     GroundTruthEntry,
     GroundTruthLogger,
     InjectionSession,
+    load_ground_truth_file,
 )
 from core.bug_templates import BugCategory, BugDifficulty, BugSeverity, BugTemplate
 from core.plugins.base import CodeLocation, CodeModification, InjectionResult
 
 
+def _entry(entry_id):
+    """Build a ground truth entry with fixed field values."""
+    return GroundTruthEntry(
+        id=entry_id,
+        injection_id="inj",
+        template_id="tpl",
+        project_path="/test/project",
+        language="java",
+        file_path="src/Test.java",
+        line_number=42,
+        bug_type="correctness",
+        description="Test bug",
+        severity="high",
+        difficulty="easy",
+        injection_timestamp="2024-01-01T00:00:00",
+        original_code="a",
+        modified_code="b",
+    )
+
+
 class TestGroundTruthEntry:
     """Test the GroundTruthEntry class."""
 
@@ -97,6 +121,56 @@ class TestGroundTruthEntry:
         assert "test_id" in jsonl
         assert "java" in jsonl
 
+    def test_to_dict_matches_asdict(self):
+        """The explicit to_dict covers every field in declaration order."""
+        entry = _entry("a")
+        entry.metadata = {"template_tags": ["x"]}
+        assert list(entry.to_dict().items()) == list(asdict(entry).items())
+        assert entry.to_dict()["metadata"] is entry.metadata
+
+
+class TestLoadGroundTruthFile:
+    """Test loading ground truth JSONL files."""
+
+    def test_load_skips_blank_lines(self, tmp_path):
+        """Blank lines are ignored and entries are returned in order."""
+        path = tmp_path / "gt.jsonl"
+        path.write_text(_entry("a").to_jsonl() + "\n\n" + _entry("b").to_jsonl() + "\n")
+
+        entries = load_ground_truth_file(path)
+        assert [e.id for e in entries] == ["a", "b"]
+
+    def test_load_reports_bad_lines(self, tmp_path):
+        """Malformed lines are passed to the error callback with their line number."""
+        path = tmp_path / "gt.jsonl"
+        path.write_text("not json\n" + _entry("a").to_jsonl() + "\n")
+        errors = []
+
+        entries = load_ground_truth_file(path, on_error=lambda n, e: errors.append(n))
+        assert [e.id for e in entries] == ["a"]
+        assert errors == [1]
+
+        with pytest.raises(ValueError):
+            load_ground_truth_file(path)
+
+    def test_load_interns_repeated_fields(self, tmp_path):
+        """Repeated categorical values share a single string object."""
+        path = tmp_path / "gt.jsonl"
+        path.write_text(_entry("a").to_jsonl() + "\n" + _entry("b").to_jsonl() + "\n")
+
+        first, second = load_ground_truth_file(path)
+        assert first.file_path is second.file_path
+        assert first.severity is second.severity
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_entries_are_slotted(self):
+        """Entries and sessions carry no per-instance __dict__."""
+        assert not hasattr(_entry("a"), "__dict__")
+        session = InjectionSession(
+            session_id="s", project_path="/p", language="java", start_time="t"
+        )
+        assert not hasattr(session, "__dict__")
+
 
 class TestInjectionSession:
     """Test the InjectionSession class."""
@@ -131,6 +205,17 @@ class TestInjectionSession:
         assert session_dict["language"] == "java"
         assert session_dict["total_injections"] == 0
 
+    def test_to_dict_matches_asdict(self):
+        """The explicit to_dict covers every field in declaration order."""
+        session = InjectionSession(
+            session_id="test_session",
+            project_path="/test/project",
+            language="java",
+            start_time="2024-01-01T00:00:00",
+            metadata={"k": "v"},
+        )
+        assert list(session.to_dict().items()) == list(asdict(session).items())
+
 
 class TestGroundTruthLogger:
     """Test the GroundTruthLogger class."""
@@ -206,6 +291,108 @@ class TestGroundTruthLogger:
             assert session.successful_injections == 1
             assert session.failed_injections == 0
 
+    def _log_mock_injection(self, logger, session_id, line_number):
+        injection = MagicMock()
+        injection.template_id = "test_template"
+        injection.location.file_path = "src/Test.java"
+        injection.location.line_number = line_number
+        injection.parameters = {}
+        injection.metadata = {}
+
+        result = MagicMock()
+        result.success = True
+        result.modifications = []
+        result.metadata = {}
+
+        template = MagicMock()
+        template.category.value = "correctness"
+        template.description = "Test bug"
+        template.severity.value = "high"
+        template.difficulty.value = "easy"
+        template.patterns = []
+        template.tags = []
+
+        return logger.log_injection(session_id, injection, result, template)
+
+    def test_log_injection_buffers_until_flush(self, tmp_path):
+        """Entries are written in one batch on flush and read back in order."""
+        logger = GroundTruthLogger(tmp_path)
+        session_id = logger.start_session("/test/project", "java")
+        log_file = tmp_path / f"{session_id}.jsonl"
+
+        for line_number in (1, 2, 3):
+            self._log_mock_injection(logger, session_id, line_number)
+        assert not log_file.exists()
+
+        entries = logger.get_session_logs(session_id)
+        assert [e.line_number for e in entries] == [1, 2, 3]
+        assert len(log_file.read_text().splitlines()) == 3
+
+        self._log_mock_injection(logger, session_id, 4)
+        logger.end_session(session_id)
+        assert len(log_file.read_text().splitlines()) == 4
+
+    def test_bug_type_and_file_counts_tracked_in_memory(self, tmp_path):
+        """Per bug type and per file counts are available without flushing the log."""
+        logger = GroundTruthLogger(tmp_path)
+        session_id = logger.start_session("/test/project", "java")
+
+        for line_number in (1, 2):
+            self._log_mock_injection(logger, session_id, line_number)
+
+        assert logger.get_bug_type_counts(session_id) == {"correctness": 2}
+        assert logger.get_file_counts(session_id) == {"src/Test.java": 2}
+        assert logger.get_bug_type_counts("unknown") == {}
+        assert not (tmp_path / f"{session_id}.jsonl").exists()
+
+        # Per-session counts are released when the session ends
+        logger.end_session(session_id)
+        assert logger.get_bug_type_counts(session_id) == {}
+        assert logger.get_file_counts(session_id) == {}
+
+    def test_log_injection_flushes_at_threshold(self, tmp_path):
+        """The buffer is written out once it reaches FLUSH_THRESHOLD entries."""
+        logger = GroundTruthLogger(tmp_path)
+        logger.FLUSH_THRESHOLD = 2
+        session_id = logger.start_session("/test/project", "java")
+
+        self._log_mock_injection(logger, session_id, 1)
+        self._log_mock_injection(logger, session_id, 2)
+        log_file = tmp_path / f"{session_id}.jsonl"
+        assert len(log_file.read_text().splitlines()) == 2
+
+    def test_log_file_opened_only_to_flush(self, tmp_path):
+        """Each non-empty flush opens and closes the log; empty flushes do not touch it."""
+        logger = GroundTruthLogger(tmp_path)
+        session_id = logger.start_session("/test/project", "java")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            for line_number in (1, 2):
+                self._log_mock_injection(logger, session_id, line_number)
+            logger.flush(session_id)
+            logger.flush(session_id)
+            logger.end_session(session_id)
+        assert mock_open.call_count == 1
+        assert len((tmp_path / f"{session_id}.jsonl").read_text().splitlines()) == 2
+
+    def test_export_session_summary(self, tmp_path):
+        """Test that the session summary is written as indented JSON."""
+        logger = GroundTruthLogger(tmp_path / "logs")
+        session_id = logger.start_session("/test/project", "java")
+        log_file = logger.log_dir / f"{session_id}.jsonl"
+        log_file.write_text(_entry("a").to_jsonl() + "\n")
+        logger.session_logs[session_id].total_injections = 1
+        logger.session_logs[session_id].successful_injections = 1
+
+        output_file = tmp_path / "summary.json"
+        logger.export_session_summary(session_id, output_file)
+
+        summary = json.loads(output_file.read_text())
+        assert summary["session"]["session_id"] == session_id
+        assert [e["id"] for e in summary["entries"]] == ["a"]
+        assert summary["statistics"]["success_rate"] == 1.0
+        assert output_file.read_text().startswith('{\n  "session"')
+
 
 class TestBugInjectionEngine:
     """Test the BugInjectionEngine class."""
@@ -283,6 +470,34 @@ class TestBugInjectionEngine:
             assert "error" in summary
             assert summary["error"] == "No active session"
 
+    def test_inject_random_bugs_reuses_targets_until_file_changes(self, tmp_path):
+        """Targets are scanned once per file/template until a bug is injected into the file."""
+        engine = BugInjectionEngine(tmp_path, Path("/non/existent/templates"))
+        engine.current_session = "session"
+        engine.ground_truth_logger = MagicMock()
+
+        template = MagicMock(id="template")
+        engine.template_manager = MagicMock()
+        engine.template_manager.get_filtered.return_value = [template]
+
+        plugin = MagicMock()
+        plugin.find_source_files.return_value = [tmp_path / "A.java"]
+        plugin.find_injection_targets.return_value = []
+        engine.plugin_manager = MagicMock()
+        engine.plugin_manager.get_plugin.return_value = plugin
+
+        assert engine.inject_random_bugs("java", count=5) == []
+        assert plugin.find_injection_targets.call_count == 1
+
+        plugin.find_injection_targets.reset_mock()
+        plugin.find_injection_targets.return_value = [MagicMock()]
+        assert len(engine.inject_random_bugs("java", count=3)) == 3
+        assert plugin.find_injection_targets.call_count == 3
+
+        # Injections go straight to the language plugin
+        assert plugin.inject_bug.call_count == 3
+        engine.plugin_manager.inject_bug.assert_not_called()
+
     def test_get_available_templates(self):
         """Test getting available templates with filtering."""
         with tempfile.TemporaryDirectory() as temp_dir:
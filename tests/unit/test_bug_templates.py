@@ -2,6 +2,7 @@
 Unit tests for the bug template system.
 """
 
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +18,7 @@ from core.bug_templates import (
     BugTemplateManager,
     BugTemplateRenderer,
 )
+from core.template_cache import TemplateCache
 
 
 class TestBugTemplateManager:
@@ -36,7 +38,7 @@ class TestBugTemplateManager:
         assert manager.template_dir == custom_dir
 
     @patch("builtins.open")
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_load_taxonomy_success(self, mock_yaml_load, mock_open):
         """Test successful taxonomy loading."""
         mock_taxonomy = {
@@ -49,7 +51,7 @@ class TestBugTemplateManager:
         assert manager.taxonomy == mock_taxonomy
 
     @patch("builtins.open")
-    @patch("yaml.safe_load")
+    @patch("yaml.load")
     def test_load_taxonomy_file_not_found(self, mock_yaml_load, mock_open):
         """Test taxonomy loading when file doesn't exist."""
         mock_open.side_effect = FileNotFoundError()
@@ -103,6 +105,53 @@ class TestBugTemplateManager:
         results = manager.get_templates_by_difficulty(BugDifficulty.EASY)
         assert results == []
 
+    def test_create_template_from_dict_enum_values(self):
+        """Enum fields default when missing and reject unknown values."""
+        manager = BugTemplateManager(Path("/non/existent/path"))
+
+        template = manager._create_template_from_dict({"id": "t", "severity": "high"}, "java")
+        assert template.category is BugCategory.CORRECTNESS
+        assert template.severity is BugSeverity.HIGH
+        assert template.difficulty is BugDifficulty.MEDIUM
+
+        assert manager._create_template_from_dict({"id": "t", "category": "bogus"}, "java") is None
+        assert manager._create_template_from_dict({"id": "t", "severity": ["high"]}, "java") is None
+
+    def test_indexed_lookups_and_get_filtered(self, tmp_path):
+        """Lookups use the indexes built at load time and keep load order."""
+        lang_dir = tmp_path / "java"
+        lang_dir.mkdir()
+        (lang_dir / "bugs.yaml").write_text(
+            '- id: "java_a"\n  name: "A"\n  description: "d"\n'
+            '  category: "correctness"\n  severity: "high"\n  difficulty: "easy"\n'
+            '- id: "java_b"\n  name: "B"\n  description: "d"\n'
+            '  category: "security_lite"\n  severity: "low"\n  difficulty: "hard"\n'
+            '- id: "java_c"\n  name: "C"\n  description: "d"\n'
+            '  category: "correctness"\n  severity: "low"\n  difficulty: "hard"\n'
+        )
+        manager = BugTemplateManager(tmp_path)
+
+        def ids(templates):
+            return [t.id for t in templates]
+
+        assert ids(manager.get_templates_by_language("java")) == ["java_a", "java_b", "java_c"]
+        assert ids(manager.get_templates_by_category(BugCategory.CORRECTNESS)) == [
+            "java_a",
+            "java_c",
+        ]
+        assert ids(manager.get_templates_by_severity(BugSeverity.LOW)) == ["java_b", "java_c"]
+        assert ids(manager.get_templates_by_difficulty(BugDifficulty.HARD)) == ["java_b", "java_c"]
+        assert ids(manager.get_filtered("java", ["correctness"], ["hard"])) == ["java_c"]
+        assert ids(manager.get_filtered("java", difficulties=["hard"])) == ["java_b", "java_c"]
+        assert manager.get_filtered("python") == []
+        assert manager.get_filtered("java", ["bogus"]) == []
+        assert ids(manager.search_templates("b")) == ["java_b"]
+        assert ids(manager.search_templates("D")) == ["java_a", "java_b", "java_c"]
+
+        # Returned lists are copies, so callers cannot corrupt the indexes
+        manager.get_templates_by_language("java").clear()
+        assert len(manager.get_templates_by_language("java")) == 3
+
 
 class TestBugTemplate:
     """Test the BugTemplate class."""
@@ -216,6 +265,14 @@ class TestBugInjection:
         assert injection_dict["location"]["file_path"] == "src/Calculator.java"
         assert injection_dict["location"]["line_number"] == 42
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_injection_and_location_are_slotted(self):
+        """Injections and locations carry no per-instance __dict__."""
+        location = BugLocation(file_path="src/Calculator.java", line_number=42)
+        injection = BugInjection(template_id="java_off_by_one", location=location)
+        assert not hasattr(location, "__dict__")
+        assert not hasattr(injection, "__dict__")
+
 
 class TestBugTemplateRenderer:
     """Test the BugTemplateRenderer class."""
@@ -282,3 +339,49 @@ class TestBugEnums:
         assert BugDifficulty.EASY.value == "easy"
         assert BugDifficulty.MEDIUM.value == "medium"
         assert BugDifficulty.HARD.value == "hard"
+
+
+class TestTemplateCache:
+    """Test the persistent template cache."""
+
+    def _write_template(self, template_dir, name="Cached Bug"):
+        lang_dir = template_dir / "java"
+        lang_dir.mkdir(parents=True, exist_ok=True)
+        (lang_dir / "bugs.yaml").write_text(
+            f'- id: "java_cached"\n  name: "{name}"\n  description: "d"\n'
+            '  category: "correctness"\n  severity: "high"\n  difficulty: "easy"\n'
+        )
+
+    def test_cache_round_trip(self, tmp_path):
+        """Templates loaded once are served from the cache afterwards."""
+        template_dir = tmp_path / "templates"
+        self._write_template(template_dir)
+        cache = TemplateCache(tmp_path / "cache" / "state.pkl")
+
+        first = BugTemplateManager(template_dir, cache=cache)
+        assert first.get_template_count() == 1
+        assert cache.cache_file.exists()
+
+        with patch.object(BugTemplateManager, "_load_templates") as mock_load:
+            second = BugTemplateManager(template_dir, cache=cache)
+            mock_load.assert_not_called()
+        assert second.get_template("java_cached").name == "Cached Bug"
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        """Changing a template file invalidates the cached state."""
+        template_dir = tmp_path / "templates"
+        self._write_template(template_dir)
+        cache = TemplateCache(tmp_path / "state.pkl")
+        BugTemplateManager(template_dir, cache=cache)
+
+        self._write_template(template_dir, name="Renamed Bug With Longer Name")
+        manager = BugTemplateManager(template_dir, cache=cache)
+        assert manager.get_template("java_cached").name == "Renamed Bug With Longer Name"
+
+    def test_clear(self, tmp_path):
+        """Clearing removes the cache file."""
+        cache = TemplateCache(tmp_path / "state.pkl")
+        assert cache.clear() is False
+        cache.store(tmp_path, {"templates": {}, "taxonomy": {}})
+        assert cache.clear() is True
+        assert not cache.cache_file.exists()
@@ -0,0 +1,54 @@
+"""
+Unit tests for buffered CLI output.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from cli.output import Echo, format_match_details
+
+
+class TestEcho:
+    """Test the Echo output buffer."""
+
+    def test_buffers_until_flush(self):
+        """Lines are written with a single click.echo call on flush."""
+        echo = Echo()
+        with patch("cli.output.click.echo") as mock_echo:
+            echo("first")
+            echo()
+            echo("second")
+            mock_echo.assert_not_called()
+
+            echo.flush()
+            mock_echo.assert_called_once_with("first\n\nsecond")
+
+        assert echo.buffer == []
+
+    def test_flush_empty_buffer(self):
+        """Flushing an empty buffer writes nothing."""
+        with patch("cli.output.click.echo") as mock_echo:
+            Echo().flush()
+            mock_echo.assert_not_called()
+
+
+class TestFormatMatchDetails:
+    """Test the verbose match listing."""
+
+    def test_formats_each_match(self):
+        """Each match becomes a four-line entry under a single header."""
+        match = SimpleNamespace(
+            finding=SimpleNamespace(file_path="src/A.java", line_number=7),
+            match_strategy=SimpleNamespace(value="exact_overlap"),
+            confidence=0.5,
+            overlap_score=1.0,
+        )
+
+        assert format_match_details([match]) == (
+            "🔍 Detailed Match Information:\n"
+            "  1. src/A.java:7\n"
+            "     Strategy: exact_overlap\n"
+            "     Confidence: 0.500\n"
+            "     Overlap Score: 1.000"
+        )
+        assert format_match_details([]) == "🔍 Detailed Match Information:"
@@ -5,10 +5,16 @@ These tests focus on testing the CLI interface structure and help text
 rather than full execution, which requires extensive mocking.
 """
 
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import click
 import pytest
 from click.testing import CliRunner
 
-from cli.main import cli
+from cli.main import LazyConfig, LazyGroup, cli
 
 
 class TestCLIInterface:
@@ -42,6 +48,98 @@ class TestCLIInterface:
         assert result.exit_code == 0
 
 
+class TestCLILazyLoading:
+    """Test that subcommands are only imported when needed."""
+
+    def test_import_does_not_load_core(self):
+        """Importing the CLI entry point must not import core modules."""
+        code = "import sys, cli.main; print(any(m.startswith('core') for m in sys.modules))"
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2], text=True
+        )
+        assert output.strip() == "False"
+
+    def test_help_lists_lazy_commands(self):
+        """Test that lazily registered commands appear in the help output."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in ["demo", "evaluate", "generate-pr", "list-bugs", "list-prs", "replay"]:
+            assert name in result.output
+
+    def test_help_does_not_import_commands(self):
+        """Top-level help is rendered without importing any subcommand module."""
+        code = (
+            "import sys\n"
+            "from cli.main import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(any(m.startswith(('cli.commands.', 'core')) for m in sys.modules))\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2], text=True
+        )
+        assert output.strip().splitlines()[-1] == "False"
+
+    def test_lazy_short_help_matches_commands(self):
+        """The static help text matches each command's own short help."""
+        ctx = click.Context(cli)
+        for name, text in cli.lazy_short_help.items():
+            assert cli.get_command(ctx, name).get_short_help_str(100) == text
+
+    def test_loaded_command_is_registered(self):
+        """Test that a lazily loaded command is resolved only once."""
+        group = LazyGroup(lazy_subcommands={"demo": "cli.commands.demo.demo"})
+        ctx = click.Context(group)
+
+        command = group.get_command(ctx, "demo")
+        assert isinstance(command, click.Command)
+        assert group.get_command(ctx, "demo") is command
+        assert group.list_commands(ctx) == ["demo"]
+
+    def test_non_command_target_rejected(self):
+        """Test that a lazy path must point at a Click command."""
+        group = LazyGroup(lazy_subcommands={"bad": "cli.output.Echo"})
+        with pytest.raises(ValueError):
+            group.get_command(click.Context(group), "bad")
+
+
+class TestLazyConfig:
+    """Test the deferred configuration proxy."""
+
+    def test_overrides_do_not_load_config(self):
+        """CLI overrides are answered without building a ConfigManager."""
+        config = LazyConfig(None, {"language": "go"})
+        assert config.get("language") == "go"
+        assert config._manager is None
+
+    def test_other_keys_load_config(self):
+        """Non-overridden keys load the real configuration once."""
+        config = LazyConfig(None, {"language": "go"})
+        assert config.get("missing.key", "fallback") == "fallback"
+        assert config._manager is not None
+        assert config._manager.get("language") == "go"
+
+    def test_dry_run_skips_config_import(self):
+        """A dry run with an explicit language never imports core.config."""
+        code = (
+            "import sys\n"
+            "from cli.main import cli\n"
+            "try:\n"
+            "    cli(['-l', 'java', 'generate-pr', '--dry-run'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('core.config' in sys.modules)\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2], text=True
+        )
+        assert "DRY RUN MODE" in output
+        assert output.strip().splitlines()[-1] == "False"
+
+
 class TestCLICommands:
     """Test that all CLI commands exist and have proper help."""
 
@@ -165,6 +263,62 @@ class TestCLIErrorHandling:
         result = runner.invoke(cli, ["generate-pr", "--help"])
         assert result.exit_code == 0
 
+    def test_generate_pr_failure_keeps_ground_truth(self, tmp_path, monkeypatch):
+        """Ground truth for injected bugs is written even if publishing fails."""
+        from core.bug_injection import BugInjectionEngine
+        from core.bug_templates import BugCategory, BugDifficulty, BugSeverity, BugTemplate
+        from core.errors import GitError
+        from core.git_operations import GitOperations
+        from core.plugins import PluginManager
+        from core.plugins.base import CodeLocation, CodeModification, InjectionResult
+
+        templates = {
+            f"java_bug_{i}": BugTemplate(
+                id=f"java_bug_{i}",
+                name=f"Bug {i}",
+                description="d",
+                category=BugCategory.CORRECTNESS,
+                severity=BugSeverity.LOW,
+                difficulty=BugDifficulty.EASY,
+                language="java",
+            )
+            for i in range(3)
+        }
+        modification = CodeModification(
+            location=CodeLocation(file_path=Path("src/A.java"), line_number=1),
+            original_code="a",
+            modified_code="b",
+            description="d",
+        )
+        target = MagicMock(file_path="src/A.java", line_number=1)
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".git").mkdir()
+        with patch.object(
+            BugInjectionEngine, "get_available_templates", return_value=list(templates.values())
+        ), patch.object(
+            BugInjectionEngine, "find_injection_targets", return_value=[target], create=True
+        ), patch(
+            "core.bug_templates.BugTemplateManager.get_template", side_effect=templates.get
+        ), patch.object(
+            PluginManager, "validate_injection", return_value=True
+        ), patch.object(
+            PluginManager,
+            "inject_bug",
+            return_value=InjectionResult(success=True, modifications=[modification]),
+        ), patch.object(
+            GitOperations, "publish_changes", side_effect=GitError("push rejected")
+        ):
+            result = CliRunner().invoke(
+                cli, ["-l", "java", "generate-pr", "--count", "3", "--auto-push"]
+            )
+
+        assert result.exit_code == 1
+        assert "push rejected" in result.output
+        log_files = list((tmp_path / "ground_truth").glob("*.jsonl"))
+        assert len(log_files) == 1
+        assert len(log_files[0].read_text().splitlines()) == 3
+
     def test_invalid_options(self):
         """Test that invalid options show proper errors."""
         runner = CliRunner()
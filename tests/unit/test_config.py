@@ -93,3 +93,56 @@ def test_language_config():
     # Test default language
     default_config = config.get_language_config()
     assert default_config["build_tool"] == "maven"
+
+
+def test_load_config_merges_file(tmp_path):
+    """Test loading a UTF-8 YAML file over the defaults."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("language: python\ngit:\n  remote: upstream  # ünïcode\n", "utf-8")
+
+    config = ConfigManager()
+    config.load_config(config_file)
+
+    assert config.get("language") == "python"
+    assert config.get("git.remote") == "upstream"
+    assert config.get("languages.java.build_tool") == "maven"
+
+    config_file.write_text("language: [unclosed\n")
+    with pytest.raises(ConfigurationError):
+        config.load_config(config_file)
+
+
+def test_load_config_reuses_parsed_file(tmp_path, monkeypatch):
+    """Test that unchanged files are parsed once and changed files are re-parsed."""
+    import core.config
+
+    parses = []
+    real_load = core.config.yaml.load
+    monkeypatch.setattr(
+        core.config.yaml,
+        "load",
+        lambda stream, Loader: parses.append(1) or real_load(stream, Loader),
+    )
+    monkeypatch.setattr(core.config, "_YAML_CACHE", {})
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("git:\n  remote: upstream\n")
+
+    first = ConfigManager()
+    first.load_config(config_file)
+    first.set("git.remote", "changed")
+
+    second = ConfigManager()
+    second.load_config(config_file)
+    assert second.get("git.remote") == "upstream"
+    assert len(parses) == 1
+
+    config_file.write_text("git:\n  remote: downstream\n")
+    third = ConfigManager()
+    third.load_config(config_file)
+    assert third.get("git.remote") == "downstream"
+    assert len(parses) == 2
+
+    monkeypatch.setenv("REVIEWLAB_YAML_CACHE", "0")
+    ConfigManager().load_config(config_file)
+    assert len(parses) == 3
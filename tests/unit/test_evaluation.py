@@ -11,6 +11,8 @@ import pytest
 from core.bug_injection import GroundTruthEntry
 from core.errors import EvaluationError
 from core.evaluation import (
+    FINDING_TYPES_BY_VALUE,
+    MATCH_STRATEGIES_BY_VALUE,
     EvaluationEngine,
     EvaluationMetrics,
     EvaluationResult,
@@ -18,6 +20,8 @@ from core.evaluation import (
     MatchResult,
     MatchStrategy,
     ReviewFinding,
+    load_review_findings,
+    parse_finding_type,
 )
 
 
@@ -93,6 +97,51 @@ class TestReviewFinding:
         assert finding_dict["message"] == "Test finding"
 
 
+class TestLoadReviewFindings:
+    """Test loading review findings from JSON."""
+
+    def test_load_applies_defaults(self, tmp_path):
+        """Missing keys fall back to the ReviewFinding defaults."""
+        path = tmp_path / "findings.json"
+        path.write_text(
+            '[{"file_path": "src/A.java", "line_number": 3},'
+            ' {"id": "f2", "file_path": "src/A.java", "line_number": 9,'
+            ' "finding_type": "code_smell", "severity": "low"}]'
+        )
+
+        first, second = load_review_findings(path)
+
+        assert first.id == "finding_0"
+        assert first.finding_type == FindingType.BUG
+        assert first.severity == "medium"
+        assert second.id == "f2"
+        assert second.finding_type == FindingType.CODE_SMELL
+        assert first.file_path is second.file_path
+
+    def test_load_accepts_null_and_non_string_fields(self, tmp_path):
+        """Null or non-string paths and severities are kept as-is rather than interned."""
+        path = tmp_path / "findings.json"
+        path.write_text(
+            '[{"file_path": null, "line_number": 1, "severity": null},'
+            ' {"file_path": 7, "line_number": 2, "severity": 3}]'
+        )
+
+        first, second = load_review_findings(path)
+
+        assert first.file_path is None
+        assert first.severity is None
+        assert second.file_path == 7
+        assert second.severity == 3
+
+    def test_load_rejects_unknown_finding_type(self, tmp_path):
+        """An unknown finding type raises ValueError."""
+        path = tmp_path / "findings.json"
+        path.write_text('[{"file_path": "a", "line_number": 1, "finding_type": "nope"}]')
+
+        with pytest.raises(ValueError):
+            load_review_findings(path)
+
+
 class TestMatchResult:
     """Test the MatchResult class."""
 
@@ -628,3 +677,63 @@ class TestEvaluationEngine:
             assert "0.600" in report  # Precision
             assert "0.750" in report  # Recall
             assert "0.670" in report  # F1-Score
+
+    def test_candidate_buckets_match_full_scan(self):
+        """Bucketing ground truth by file yields the same matches as scanning all of it."""
+        files = ["src/a/One.java", "src/a/Two.java", "src/b/One.java", "src/b/Three.java"]
+        ground_truth = [
+            GroundTruthEntry(
+                id=f"gt_{i}",
+                injection_id=f"inj_{i}",
+                template_id="t",
+                project_path="/p",
+                language="java",
+                file_path=files[i % len(files)],
+                line_number=10 + (i * 7) % 40,
+                bug_type="correctness",
+                description="null pointer dereference in loop",
+                severity="high",
+                difficulty="easy",
+                injection_timestamp="2024-01-01T00:00:00",
+                original_code="a",
+                modified_code="b",
+            )
+            for i in range(24)
+        ]
+        findings = [
+            ReviewFinding(
+                id=f"f_{i}",
+                file_path=files[(i * 3) % len(files)],
+                line_number=8 + (i * 5) % 45,
+                end_line=12 + (i * 5) % 45 if i % 2 else None,
+                message="possible null pointer dereference",
+            )
+            for i in range(30)
+        ]
+        strategies = list(MatchStrategy)
+
+        bucketed = EvaluationEngine().evaluate_review(findings, ground_truth, strategies=strategies)
+        full_scan_engine = EvaluationEngine()
+        full_scan_engine.candidate_keys = {}
+        full_scan = full_scan_engine.evaluate_review(findings, ground_truth, strategies=strategies)
+
+        def pairs(result):
+            return [(m.finding.id, m.ground_truth.id, m.match_strategy) for m in result.matches]
+
+        assert pairs(bucketed) == pairs(full_scan)
+        assert len({m.match_strategy for m in bucketed.matches}) > 1
+
+
+class TestEnumLookups:
+    """Test the value -> enum lookup tables."""
+
+    def test_lookup_tables_cover_all_members(self):
+        """Every enum member is reachable by value."""
+        assert all(MATCH_STRATEGIES_BY_VALUE[s.value] is s for s in MatchStrategy)
+        assert all(FINDING_TYPES_BY_VALUE[t.value] is t for t in FindingType)
+
+    def test_parse_finding_type(self):
+        """Unknown values raise ValueError like the Enum constructor."""
+        assert parse_finding_type("security_issue") is FindingType.SECURITY_ISSUE
+        with pytest.raises(ValueError):
+            parse_finding_type("not_a_type")
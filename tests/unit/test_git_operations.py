@@ -289,6 +289,57 @@ class TestGitOperations:
                 assert "new.txt" in status["untracked_files"]
                 assert status["clean"] is False
 
+    @patch("subprocess.run")
+    def test_publish_changes_single_subprocess(self, mock_run):
+        """Test that branch, commit and push run as one subprocess."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="abc123\n", stderr="")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".git").mkdir()
+            git_ops = GitOperations(temp_dir)
+
+            commit_hash, pushed = git_ops.publish_changes(
+                "feature/test", "Test commit", ["a.txt", "b c.txt"], base_branch="main"
+            )
+
+        assert commit_hash == "abc123"
+        assert pushed is True
+        mock_run.assert_called_once()
+        command = mock_run.call_args[0][0]
+        assert command[:2] == ["sh", "-c"]
+        assert command[4:] == [
+            "feature/test",
+            "main",
+            "Test commit",
+            "origin",
+            "1",
+            "a.txt",
+            "b c.txt",
+        ]
+
+    @patch("subprocess.run")
+    def test_publish_changes_push_failure(self, mock_run):
+        """Test that a failed push is reported without raising."""
+        mock_run.return_value = MagicMock(returncode=3, stdout="abc123\n", stderr="denied")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".git").mkdir()
+            git_ops = GitOperations(temp_dir)
+
+            assert git_ops.publish_changes("feature/test", "msg") == ("abc123", False)
+
+    @patch("subprocess.run")
+    def test_publish_changes_commit_failure(self, mock_run):
+        """Test that failing to branch or commit raises GitError."""
+        mock_run.return_value = MagicMock(returncode=128, stdout="", stderr="fatal")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / ".git").mkdir()
+            git_ops = GitOperations(temp_dir)
+
+            with pytest.raises(GitError):
+                git_ops.publish_changes("feature/test", "msg")
+
 
 class TestGitHubIntegration:
     """Test the GitHubIntegration class."""
@@ -0,0 +1,216 @@
+"""
+Unit tests for GitHub comment extraction.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from core.errors import GitHubError
+from core.github_comments import GitHubCommentExtractor
+
+UTC = timezone.utc
+
+
+def _page(nodes, has_next_page=False):
+    return {"pageInfo": {"hasNextPage": has_next_page}, "nodes": nodes}
+
+
+def _graphql_payload(issue_comments=None, reviews=None):
+    return {
+        "data": {
+            "repository": {
+                "pullRequest": {
+                    "comments": issue_comments or _page([]),
+                    "reviews": reviews or _page([]),
+                }
+            }
+        }
+    }
+
+
+def _extractor(payload):
+    """Create an extractor whose GraphQL request returns ``payload``."""
+    extractor = GitHubCommentExtractor("test_token", cache_ttl=0)
+    extractor.session = Mock()
+    extractor.session.post.return_value.json.return_value = payload
+    extractor.github = Mock()
+    return extractor
+
+
+class TestGraphQLExtraction:
+    """Test extracting PR comments through the GraphQL API."""
+
+    def test_single_page(self):
+        """All comment kinds are mapped from one GraphQL response."""
+        payload = _graphql_payload(
+            issue_comments=_page(
+                [
+                    {
+                        "databaseId": 1,
+                        "author": {"login": "alice"},
+                        "body": "General note",
+                        "createdAt": "2024-01-01T12:00:00Z",
+                        "updatedAt": "2024-01-01T12:30:00Z",
+                    }
+                ]
+            ),
+            reviews=_page(
+                [
+                    {
+                        "databaseId": 10,
+                        "author": None,
+                        "body": "Looks risky",
+                        "submittedAt": "2024-01-02T08:00:00Z",
+                        "comments": _page(
+                            [
+                                {
+                                    "databaseId": 2,
+                                    "author": {"login": "bob"},
+                                    "body": "Off by one",
+                                    "createdAt": "2024-01-02T07:00:00Z",
+                                    "updatedAt": "2024-01-02T07:00:00Z",
+                                    "path": "src/A.java",
+                                    "line": 42,
+                                    "diffHunk": "@@ -1 +1 @@",
+                                    "position": 3,
+                                    "commit": {"oid": "abc123"},
+                                }
+                            ]
+                        ),
+                    },
+                    {
+                        "databaseId": 11,
+                        "author": {"login": "carol"},
+                        "body": "",
+                        "submittedAt": "2024-01-03T08:00:00Z",
+                        "comments": _page([]),
+                    },
+                ]
+            ),
+        )
+        extractor = _extractor(payload)
+
+        comments = extractor.extract_pr_comments("owner", "repo", 7)
+
+        assert [(c.id, c.comment_type) for c in comments] == [
+            (1, "general"),
+            (2, "line"),
+            (10, "review"),
+        ]
+        general, line, review = comments
+        assert general.author == "alice"
+        assert general.created_at == datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        assert line.file_path == "src/A.java"
+        assert line.line_number == 42
+        assert line.commit_id == "abc123"
+        assert line.position == 3
+        assert review.author == "ghost"
+        assert review.updated_at == datetime(2024, 1, 2, 8, 0, tzinfo=UTC)
+
+        variables = extractor.session.post.call_args.kwargs["json"]["variables"]
+        assert variables == {"owner": "owner", "name": "repo", "number": 7}
+        extractor.github.get_repo.assert_not_called()
+
+    def test_next_page_falls_back_to_rest(self):
+        """A connection with more pages switches to the paginated REST API."""
+        extractor = _extractor(_graphql_payload(issue_comments=_page([], has_next_page=True)))
+        pr = extractor.github.get_repo.return_value.get_pull.return_value
+        pr.get_issue_comments.return_value = [
+            MagicMock(
+                id=5,
+                user=None,
+                body="From REST",
+                created_at=datetime(2024, 1, 1, 12, 0),
+                updated_at=datetime(2024, 1, 1, 12, 0, tzinfo=UTC),
+            )
+        ]
+        pr.get_review_comments.return_value = []
+        pr.get_reviews.return_value = []
+
+        comments = extractor.extract_pr_comments("owner", "repo", 7)
+
+        extractor.github.get_repo.assert_called_once_with("owner/repo")
+        assert [c.id for c in comments] == [5]
+        assert comments[0].author == "ghost"
+        # Naive PyGithub timestamps are normalised to UTC like the GraphQL path
+        assert comments[0].created_at == datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        assert comments[0].created_at.tzinfo is not None
+        assert comments[0].updated_at == datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+    def test_graphql_errors_raise(self):
+        """GraphQL errors are reported as GitHubError."""
+        extractor = _extractor({"errors": [{"message": "Bad credentials"}]})
+
+        with pytest.raises(GitHubError, match="Bad credentials"):
+            extractor.extract_pr_comments("owner", "repo", 7)
+
+    def test_missing_pull_request_raises(self):
+        """A null pullRequest means the PR does not exist."""
+        extractor = _extractor({"data": {"repository": {"pullRequest": None}}})
+
+        with pytest.raises(GitHubError, match="#7 not found in owner/repo"):
+            extractor.extract_pr_comments("owner", "repo", 7)
+        extractor.github.get_repo.assert_not_called()
+
+
+class TestCommentCache:
+    """Test the TTL/LRU cache of extracted comments."""
+
+    def _extractor(self, cache_ttl=60.0):
+        extractor = _extractor(_graphql_payload())
+        extractor.cache_ttl = cache_ttl
+        return extractor
+
+    def test_cache_hit_returns_copy(self):
+        """Repeated extraction within the TTL reuses the first result."""
+        extractor = self._extractor()
+
+        first = extractor.extract_pr_comments("owner", "repo", 7)
+        first.append("mutated")
+        second = extractor.extract_pr_comments("owner", "repo", 7)
+
+        assert second == []
+        assert extractor.session.post.call_count == 1
+
+    def test_cache_expires_after_ttl(self, monkeypatch):
+        """Entries older than the TTL are fetched again."""
+        extractor = self._extractor(cache_ttl=60.0)
+        now = [1000.0]
+        monkeypatch.setattr("core.github_comments.time.monotonic", lambda: now[0])
+
+        extractor.extract_pr_comments("owner", "repo", 7)
+        now[0] += 60.0
+        extractor.extract_pr_comments("owner", "repo", 7)
+        assert extractor.session.post.call_count == 1
+
+        now[0] += 0.5
+        extractor.extract_pr_comments("owner", "repo", 7)
+        assert extractor.session.post.call_count == 2
+
+    def test_least_recently_used_entry_evicted(self):
+        """The cache holds at most COMMENT_CACHE_SIZE PRs, evicting the oldest use."""
+        extractor = self._extractor()
+        extractor.COMMENT_CACHE_SIZE = 2
+
+        extractor.extract_pr_comments("owner", "repo", 1)
+        extractor.extract_pr_comments("owner", "repo", 2)
+        extractor.extract_pr_comments("owner", "repo", 1)  # hit; PR 2 is now oldest
+        extractor.extract_pr_comments("owner", "repo", 3)  # evicts PR 2
+        assert extractor.session.post.call_count == 3
+
+        extractor.extract_pr_comments("owner", "repo", 1)
+        assert extractor.session.post.call_count == 3
+        extractor.extract_pr_comments("owner", "repo", 2)
+        assert extractor.session.post.call_count == 4
+
+    def test_zero_ttl_disables_cache(self):
+        """With cache_ttl=0 every call goes to GitHub and nothing is stored."""
+        extractor = self._extractor(cache_ttl=0)
+
+        extractor.extract_pr_comments("owner", "repo", 7)
+        extractor.extract_pr_comments("owner", "repo", 7)
+
+        assert extractor.session.post.call_count == 2
+        assert not extractor._comment_cache
@@ -0,0 +1,30 @@
+"""
+Unit tests for the JSON helpers.
+"""
+
+from unittest.mock import patch
+
+from core import json_utils
+
+
+class TestJsonUtils:
+    """Test the orjson/stdlib JSON wrappers."""
+
+    def test_round_trip(self):
+        """Test that dumps and loads round-trip a document."""
+        data = {"a": 1, "b": [1, 2, 3], "c": "text"}
+        assert json_utils.loads(json_utils.dumps(data)) == data
+
+    def test_loads_bytes(self):
+        """Test that loads accepts bytes."""
+        assert json_utils.loads(b'{"x": 1}') == {"x": 1}
+
+    def test_dumps_indent(self):
+        """Test indented output uses two spaces."""
+        assert json_utils.dumps([1], indent=True) == "[\n  1\n]"
+
+    def test_stdlib_fallback(self):
+        """Test that the stdlib json module is used when orjson is unavailable."""
+        with patch.object(json_utils, "orjson", None):
+            assert json_utils.loads('{"x": 1}') == {"x": 1}
+            assert json_utils.dumps([1], indent=True) == "[\n  1\n]"
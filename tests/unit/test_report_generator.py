@@ -5,6 +5,7 @@ Unit tests for the report generator.
 import csv
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -19,7 +20,11 @@ from core.evaluation import (
     MatchStrategy,
     ReviewFinding,
 )
-from core.report_generator import ReportConfig, ReportGenerator
+from core.report_generator import (
+    ReportConfig,
+    ReportGenerator,
+    generate_reports,
+)
 
 
 class TestReportConfig:
@@ -747,3 +752,148 @@ class TestReportGenerator:
             assert severity_analysis["high"]["matches"] == 1
             assert "medium" in severity_analysis
             assert severity_analysis["medium"]["total_findings"] == 1
+
+
+class TestReportPayload:
+    """Test the shared report payload."""
+
+    def _result(self):
+        finding = ReviewFinding(id="f1", file_path="src/Test.java", line_number=42)
+        ground_truth = GroundTruthEntry(
+            id="gt1",
+            injection_id="inj",
+            template_id="tpl",
+            project_path="/test/project",
+            language="java",
+            file_path="src/Test.java",
+            line_number=42,
+            bug_type="correctness",
+            description="Test bug",
+            severity="high",
+            difficulty="easy",
+            injection_timestamp="2024-01-01T00:00:00",
+            original_code="original",
+            modified_code="modified",
+        )
+        metrics = EvaluationMetrics(
+            total_findings=1,
+            total_ground_truth=1,
+            true_positives=1,
+            false_positives=0,
+            false_negatives=0,
+            precision=1.0,
+            recall=1.0,
+            f1_score=1.0,
+            accuracy=1.0,
+        )
+        return EvaluationResult(
+            session_id="payload_session",
+            review_tool="test_tool",
+            evaluation_timestamp="2024-01-01T00:00:00",
+            metrics=metrics,
+            matches=[
+                MatchResult(
+                    finding=finding,
+                    ground_truth=ground_truth,
+                    match_strategy=MatchStrategy.EXACT_OVERLAP,
+                    confidence=1.0,
+                    overlap_score=1.0,
+                )
+            ],
+            unmatched_findings=[],
+            unmatched_ground_truth=[],
+        )
+
+    def test_build_payload(self):
+        """Test that the payload contains the primitives every format needs."""
+        payload = ReportGenerator().build_payload(self._result())
+
+        assert payload["match_breakdown"] == {"exact_overlap": 1}
+        assert payload["match_rate"] == 1.0
+        assert payload["matches"][0]["ground_truth_id"] == "gt1"
+        assert payload["detailed_analysis"]["performance_rating"] == "Excellent"
+
+    def test_payload_reused_across_formats(self):
+        """Test that a supplied payload is not rebuilt for each format."""
+        result = self._result()
+        payload = ReportGenerator().build_payload(result)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for fmt in ["json", "csv", "txt", "html"]:
+                generator = ReportGenerator(ReportConfig(output_format=fmt))
+                with patch.object(generator, "build_payload") as mock_build:
+                    report = generator.generate_comprehensive_report(
+                        result, Path(temp_dir) / f"report.{fmt}", payload=payload
+                    )
+                    mock_build.assert_not_called()
+                assert report.exists()
+
+            with open(Path(temp_dir) / "report.csv", newline="") as f:
+                rows = list(csv.reader(f))
+            assert rows[-1][:4] == ["f1", "f1", "gt1", "exact_overlap"]
+
+    def test_generate_reports_concurrently(self):
+        """Test rendering several formats at once keeps the target order."""
+        result = self._result()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            targets = [(fmt, Path(temp_dir) / f"report.{fmt}") for fmt in ["json", "csv", "txt"]]
+            reports = generate_reports(result, targets, include_detailed_matches=True)
+
+            assert reports == [path for _, path in targets]
+            assert all(path.exists() for path in reports)
+            with open(reports[0]) as f:
+                assert json.load(f)["report_info"]["evaluation_session"] == "payload_session"
+
+    def test_generate_reports_builds_payload_once(self):
+        """Test that every format is rendered from a single payload."""
+        result = self._result()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            targets = [(fmt, Path(temp_dir) / f"report.{fmt}") for fmt in ["json", "csv", "html"]]
+            payload = ReportGenerator().build_payload(result)
+            with patch.object(ReportGenerator, "build_payload", return_value=payload) as mock_build:
+                reports = generate_reports(result, targets)
+            assert mock_build.call_count == 1
+            assert all(path.exists() for path in reports)
+
+        assert generate_reports(result, []) == []
+
+    def test_json_report_serializes_non_json_metadata(self):
+        """Test that metadata values without a JSON type are written as strings."""
+        result = self._result()
+        result.metadata = {"started": datetime(2024, 1, 1, 12, 0)}
+        generator = ReportGenerator(ReportConfig(output_format="json"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = generator.generate_comprehensive_report(result, Path(temp_dir) / "r.json")
+            with open(report) as f:
+                data = json.load(f)
+
+        assert data["metadata"]["started"].startswith("2024-01-01")
+        assert data["matches"][0]["ground_truth_id"] == "gt1"
+
+    def test_collect_match_stats(self):
+        """Test that one pass yields the strategy, file and severity breakdowns."""
+        stats = ReportGenerator()._collect_match_stats(self._result())
+
+        assert stats["match_breakdown"] == {"exact_overlap": 1}
+        assert stats["file_analysis"] == {"src/Test.java": {"matches": 1, "total_findings": 0}}
+        assert stats["severity_analysis"] == {"medium": {"matches": 1, "total_findings": 0}}
+
+    def test_output_format_override(self):
+        """Test that one generator can render several formats."""
+        result = self._result()
+        generator = ReportGenerator(ReportConfig(output_format="json"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report = generator.generate_comprehensive_report(
+                result, Path(temp_dir) / "report.csv", output_format="csv"
+            )
+            with open(report, newline="") as f:
+                assert next(csv.reader(f))[0] == "Report Title"
+
+            with pytest.raises(Exception, match="Unsupported output format"):
+                generator.generate_comprehensive_report(
+                    result, Path(temp_dir) / "report.pdf", output_format="pdf"
+                )
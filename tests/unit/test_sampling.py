@@ -0,0 +1,46 @@
+"""
+Unit tests for the sampling helpers.
+"""
+
+import random
+
+import pytest
+
+from core.sampling import fast_sample
+
+
+class TestFastSample:
+    """Test the fast_sample helper."""
+
+    def test_small_sample_is_distinct_and_ordered(self):
+        """Small samples use insertion sampling and keep population order."""
+        population = list(range(100))
+        result = fast_sample(population, 5, random.Random(42))
+        assert len(result) == 5
+        assert len(set(result)) == 5
+        assert result == sorted(result)
+
+    def test_large_sample_falls_back(self):
+        """Large samples delegate to random.sample."""
+        population = list(range(10))
+        result = fast_sample(population, 8, random.Random(1))
+        assert len(set(result)) == 8
+        assert set(result) <= set(population)
+
+    def test_seed_is_reproducible(self):
+        """The same seed yields the same sample."""
+        population = [f"t{i}" for i in range(200)]
+        assert fast_sample(population, 4, random.Random(7)) == fast_sample(
+            population, 4, random.Random(7)
+        )
+
+    def test_invalid_k(self):
+        """Negative or oversized samples raise ValueError."""
+        with pytest.raises(ValueError):
+            fast_sample([1, 2], 3)
+        with pytest.raises(ValueError):
+            fast_sample([1, 2], -1)
+
+    def test_zero(self):
+        """An empty sample is allowed."""
+        assert fast_sample([1, 2, 3], 0) == []